@@ -3,7 +3,6 @@ from . import tickets
 from . import chatbot_controller
 from . import project_conf
 from . import admin_tickets
-from . import landing_chat
 from . import auth
 from . import customer
 from . import admin_users
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+Access Helpers
+==============
+Shared lookups used by the portal controllers to gate routes by role.
+
+The stock groups and the public user are referenced by XML id on almost
+every request. Their database ids never change once a database is loaded,
+so they are resolved through ir.model.data once per database and kept for
+the lifetime of the worker process.
+"""
+
+import functools
+from urllib.parse import quote_plus
+
+import werkzeug
+from odoo.http import request
+
+LOGIN_URL = "/customer_support/login"
+
+_REF_IDS = {}
+
+# Portal entry point per role, checked in order; the first group the user
+# holds wins.
+ROLE_DASHBOARDS = (
+    ("base.group_system", "/customer_support/admin_dashboard"),
+    ("base.group_portal", "/customer_support/dashboard"),
+    ("base.group_user", "/customer_support/support_dashboard"),
+)
+
+
+def ref_id(env, xmlid):
+    """Return the database id behind ``xmlid``, resolving it once per database."""
+    key = (env.cr.dbname, xmlid)
+    res_id = _REF_IDS.get(key)
+    if res_id is None:
+        res_id = _REF_IDS[key] = env.ref(xmlid).id
+    return res_id
+
+
+def public_user_id(env):
+    """Database id of base.public_user."""
+    return ref_id(env, "base.public_user")
+
+
+def request_has_group(req, xmlid):
+    """Whether the request's user holds group ``xmlid``, checked once per request."""
+    uid = req.env.uid
+    cached = getattr(req, "_cs_groups", None)
+    if cached is None or cached[0] != uid:
+        cached = (uid, {})
+        req._cs_groups = cached
+    groups = cached[1]
+    if xmlid not in groups:
+        groups[xmlid] = req.env.user.has_group(xmlid)
+    return groups[xmlid]
+
+
+def request_is_admin(req):
+    """Whether the request's user is in base.group_system."""
+    return request_has_group(req, "base.group_system")
+
+
+def admin_required(handler):
+    """Send users outside base.group_system back to the customer dashboard.
+
+    Place directly below ``@http.route``; the group check is shared with
+    request_is_admin(), so it runs at most once per request.
+    """
+
+    @functools.wraps(handler)
+    def wrapper(*args, **kwargs):
+        if not request_is_admin(request):
+            return werkzeug.utils.redirect("/customer_support/dashboard")
+        return handler(*args, **kwargs)
+
+    return wrapper
+
+
+def role_dashboard_url(user):
+    """Dashboard URL for ``user``'s role, or "" when they hold none of them.
+
+    Reads the user's groups once and compares ids, rather than one
+    has_group() call per role.
+    """
+    group_ids = set(user.sudo().all_group_ids.ids)
+    for xmlid, url in ROLE_DASHBOARDS:
+        if ref_id(user.env, xmlid) in group_ids:
+            return url
+    return ""
+
+
+def user_roles(user):
+    """Return ``(is_admin, is_portal, is_internal)`` for ``user``.
+
+    All three come from a single read of the user's groups, for handlers
+    that branch on more than one role.
+    """
+    group_ids = set(user.sudo().all_group_ids.ids)
+    return tuple(
+        ref_id(user.env, xmlid) in group_ids for xmlid, _url in ROLE_DASHBOARDS
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def login_error_url(error):
+    """Login page URL showing ``error``.
+
+    Callers pass fixed messages, so each URL is encoded once per process.
+    """
+    return f"{LOGIN_URL}?error={quote_plus(error)}"
+
+
+def login_redirect(error):
+    """Redirect to the portal login page showing ``error``."""
+    return werkzeug.utils.redirect(login_error_url(error))
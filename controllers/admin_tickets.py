@@ -6,6 +6,7 @@ import werkzeug
 
 from odoo import http
 from odoo.http import request
+from .access import request_is_admin
 
 _logger = logging.getLogger(__name__)
 
@@ -47,15 +48,15 @@ class AdminTicketController(http.Controller):
     )
     def admin_ticket_quick_view(self, ticket_id, **kw):
         """Return ticket details as JSON for admin dashboard popup."""
-        user = request.env.user
-        if not user.has_group("base.group_system"):
+        if not request_is_admin(request):
             return request.make_response(
                 json.dumps({"success": False, "error": "Access denied"}),
                 headers=[("Content-Type", "application/json")],
                 status=403,
             )
 
-        ticket = request.env["customer.support"].sudo().browse(ticket_id)
+        su_env = request.env(su=True)
+        ticket = su_env["customer.support"].browse(ticket_id)
         if not ticket.exists():
             return request.make_response(
                 json.dumps({"success": False, "error": "Ticket not found"}),
@@ -63,17 +64,13 @@ class AdminTicketController(http.Controller):
                 status=404,
             )
 
-        attachments = (
-            request.env["ir.attachment"]
-            .sudo()
-            .search(
-                [("res_model", "=", "customer.support"), ("res_id", "=", ticket.id)]
-            )
+        attachments = su_env["ir.attachment"].search(
+            [("res_model", "=", "customer.support"), ("res_id", "=", ticket.id)]
         )
+        # Tokenise the attachments that lack one in a single call before building URLs.
+        attachments.filtered(lambda a: not a.access_token).generate_access_token()
         payload_attachments = []
         for attach in attachments:
-            if not attach.access_token:
-                attach.sudo().generate_access_token()
             payload_attachments.append(
                 {
                     "id": attach.id,
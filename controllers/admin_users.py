@@ -23,16 +23,41 @@ Email notifications are delegated to EmailService:
 
 import json
 import logging
-from urllib.parse import urlencode
+from collections import Counter
+from urllib.parse import quote_plus, urlencode
 from datetime import timedelta
+from psycopg2 import errors as pg_errors
 from odoo import http, fields
+from odoo.exceptions import MissingError
 from odoo.http import request
 import werkzeug
 
 from ..services.email_service import EmailService
+from .access import (
+    admin_required,
+    public_user_id,
+    ref_id,
+    request_is_admin,
+    user_roles,
+)
 
 _logger = logging.getLogger(__name__)
 
+# Tickets rendered per page in the admin Ticket Assignment tab.
+ADMIN_TICKET_PAGE_SIZE = 50
+
+# Form pages that user create/update errors bounce back to.
+_CREATE_USER_ERROR_URL = "/customer_support/admin_dashboard/create_user?error={}"
+_EDIT_USER_ERROR_URL = "/customer_support/admin_dashboard/user/{}/edit?error={}"
+
+# Required form fields, checked in order; the first blank one is reported.
+_CREATE_USER_REQUIRED = (
+    ("name", "Name is required"),
+    ("email", "Email is required"),
+    ("password", "Password is required"),
+)
+_EDIT_USER_REQUIRED = _CREATE_USER_REQUIRED[:2]
+
 
 class CustomerSupportAdminUsers(http.Controller):
     """
@@ -53,6 +78,43 @@ class CustomerSupportAdminUsers(http.Controller):
             f"/customer_support/admin_dashboard?{urlencode(params)}"
         )
 
+    def _redirect_create_user_error(self, error):
+        return werkzeug.utils.redirect(
+            _CREATE_USER_ERROR_URL.format(quote_plus(error))
+        )
+
+    def _redirect_edit_user_error(self, user_id, error):
+        return werkzeug.utils.redirect(
+            _EDIT_USER_ERROR_URL.format(user_id, quote_plus(error))
+        )
+
+    def _group_user_ids(self, xmlid):
+        """Ids of every user (archived included) holding the group, implied groups counted."""
+        group = (
+            request.env["res.groups"]
+            .sudo()
+            .with_context(active_test=False)
+            .browse(ref_id(request.env, xmlid))
+        )
+        return set(group.all_user_ids.ids)
+
+    def _active_focal_persons(self):
+        """Active internal users, selected by group membership in one search."""
+        # all_group_ids also matches users who get group_user through an
+        # implied group; the membership join is done in SQL.
+        return (
+            request.env["res.users"]
+            .sudo()
+            .search(
+                [
+                    ("all_group_ids", "in", [ref_id(request.env, "base.group_user")]),
+                    ("id", ">", 1),
+                    ("id", "!=", public_user_id(request.env)),
+                    ("active", "=", True),
+                ]
+            )
+        )
+
     def _load_admin_read_keys(self):
         raw = (
             request.env["ir.config_parameter"]
@@ -189,13 +251,15 @@ class CustomerSupportAdminUsers(http.Controller):
     # =========================================================================
 
     @http.route(
-        "/customer_support/admin_dashboard", type="http", auth="user", website=True
+        "/customer_support/admin_dashboard",
+        type="http",
+        auth="user",
+        website=True,
+        readonly=True,
     )
+    @admin_required
     def admin_dashboard(self, **kw):
         user = request.env.user
-        if not user.has_group("base.group_system"):
-            return werkzeug.utils.redirect("/customer_support/dashboard")
-
         Ticket = request.env["customer.support"]
         selected_project_id = 0
         raw_project_id = (request.params.get("project_id") or "").strip()
@@ -205,91 +269,101 @@ class CustomerSupportAdminUsers(http.Controller):
         if assignment_filter not in {"all", "assigned", "unassigned"}:
             assignment_filter = "all"
 
-        base_tickets = Ticket.search([])
-        all_projects_ticket_count = len(base_tickets)
-        project_ticket_counts = {}
-        for t in base_tickets:
-            pid = t.project_id.id if t.project_id else 0
-            project_ticket_counts[pid] = project_ticket_counts.get(pid, 0) + 1
-
+        page = 1
+        raw_page = (request.params.get("page") or "").strip()
+        if raw_page.isdigit():
+            page = max(int(raw_page), 1)
+
+        # Per-project totals for the filter dropdown and the per-state cards
+        # both come from one GROUP BY project_id, state.
+        project_ticket_counts = Counter()
+        state_counts = Counter()
+        for row in Ticket.read_group(
+            [], ["project_id", "state"], ["project_id", "state"], lazy=False
+        ):
+            project_key = row["project_id"][0] if row["project_id"] else 0
+            project_ticket_counts[project_key] += row["__count"]
+            state_counts[row["state"]] += row["__count"]
+        project_ticket_counts = dict(project_ticket_counts)
+        all_projects_ticket_count = sum(project_ticket_counts.values())
+
+        scope_domain = []
         if selected_project_id:
-            scoped_tickets = base_tickets.filtered(
-                lambda t: t.project_id and t.project_id.id == selected_project_id
-            )
-        else:
-            scoped_tickets = base_tickets
-
+            scope_domain = [("project_id", "=", selected_project_id)]
+        scoped_count = (
+            project_ticket_counts.get(selected_project_id, 0)
+            if selected_project_id
+            else all_projects_ticket_count
+        )
+        assigned_count = Ticket.search_count(
+            scope_domain + [("assigned_to", "!=", False)]
+        )
         assignment_counts = {
-            "all": len(scoped_tickets),
-            "assigned": len(scoped_tickets.filtered(lambda t: bool(t.assigned_to))),
-            "unassigned": len(scoped_tickets.filtered(lambda t: not t.assigned_to)),
+            "all": scoped_count,
+            "assigned": assigned_count,
+            "unassigned": scoped_count - assigned_count,
         }
 
-        tickets = Ticket.search([]).sorted(key=lambda r: r.create_date, reverse=True)
+        # Only the requested page of the filtered list is loaded.
+        list_domain = list(scope_domain)
+        if assignment_filter == "assigned":
+            list_domain.append(("assigned_to", "!=", False))
+        elif assignment_filter == "unassigned":
+            list_domain.append(("assigned_to", "=", False))
+        page_count = max(
+            (assignment_counts[assignment_filter] + ADMIN_TICKET_PAGE_SIZE - 1)
+            // ADMIN_TICKET_PAGE_SIZE,
+            1,
+        )
+        page = min(page, page_count)
+        tickets = Ticket.search(
+            list_domain,
+            order="create_date desc",
+            limit=ADMIN_TICKET_PAGE_SIZE,
+            offset=(page - 1) * ADMIN_TICKET_PAGE_SIZE,
+        )
+        ticket_pager = {
+            "page": page,
+            "page_count": page_count,
+            "page_size": ADMIN_TICKET_PAGE_SIZE,
+        }
 
         ticket_counts = {
-            "new": len(tickets.filtered(lambda t: t.state == "new")),
-            "assigned": len(tickets.filtered(lambda t: t.state == "assigned")),
-            "resolved": len(tickets.filtered(lambda t: t.state == "resolved")),
-            "closed": len(tickets.filtered(lambda t: t.state == "closed")),
-            "total": len(tickets),
+            "new": state_counts.get("new", 0),
+            "assigned": state_counts.get("assigned", 0),
+            "resolved": state_counts.get("resolved", 0),
+            "closed": state_counts.get("closed", 0),
+            "total": sum(state_counts.values()),
         }
 
-        analytics = {}
-        performance = {}
-        try:
-            dashboard_model = request.env["customer_support.dashboard"]
-            analytics = dashboard_model.get_ticket_analytics(user.id)
-            performance = dashboard_model.get_user_performance(user.id)
-        except Exception as e:
-            _logger.warning(f"Admin dashboard analytics failed: {str(e)}")
-            open_tickets = ticket_counts.get("new", 0) + ticket_counts.get(
-                "assigned", 0
-            )
-            analytics = {
-                "open_tickets": open_tickets,
-                "total_tickets": ticket_counts.get("total", 0),
-                "high_priority": 0,
-                "urgent": 0,
-                "avg_open_hours": 0,
-                "total_hours": 0,
-                "avg_high_hours": 0,
-                "avg_urgent_hours": 0,
-                "resolved_tickets": ticket_counts.get("resolved", 0)
-                + ticket_counts.get("closed", 0),
-                "solve_rate": 0,
-                "high_resolved": 0,
-                "urgent_resolved": 0,
-            }
-            performance = {
-                "today_closed": 0,
-                "avg_resolve_rate": 0,
-                "daily_target": 80.00,
-                "achievement": 0,
-                "sample_performance": 85.00,
-            }
-
-        all_users = (
+        # Only the columns the user tables show are fetched.
+        user_rows = (
             request.env["res.users"]
             .with_context(active_test=False)
-            .search(
+            .search_read(
                 [
-                    ("id", "not in", [1, request.env.ref("base.public_user").id]),
-                ]
+                    ("id", ">", 1),
+                    ("id", "!=", public_user_id(request.env)),
+                ],
+                ["name", "email", "login", "active"],
+                order="create_date desc",
             )
-            .sorted(key=lambda r: r.create_date, reverse=True)
         )
 
+        admin_ids = self._group_user_ids("base.group_system")
+        internal_ids = self._group_user_ids("base.group_user")
+        portal_ids = self._group_user_ids("base.group_portal")
+
         active_users_data = []
         deactivated_users_data = []
-        for u in all_users:
-            if u.has_group("base.group_system"):
+        for row in user_rows:
+            if row["id"] in admin_ids:
                 role = "Admin"
                 role_class = "primary"
-            elif u.has_group("base.group_user"):
+            elif row["id"] in internal_ids:
                 role = "Focal Person"
                 role_class = "info"
-            elif u.has_group("base.group_portal"):
+            elif row["id"] in portal_ids:
                 role = "Customer"
                 role_class = "secondary"
             else:
@@ -297,15 +371,15 @@ class CustomerSupportAdminUsers(http.Controller):
                 role_class = "secondary"
 
             item = {
-                "id": u.id,
-                "name": u.name,
-                "email": u.email or u.login,
+                "id": row["id"],
+                "name": row["name"],
+                "email": row["email"] or row["login"],
                 "role": role,
                 "role_class": role_class,
-                "active": u.active,
+                "active": row["active"],
             }
 
-            if u.active:
+            if row["active"]:
                 active_users_data.append(item)
             else:
                 deactivated_users_data.append(item)
@@ -315,6 +389,28 @@ class CustomerSupportAdminUsers(http.Controller):
             .sudo()
             .search([("active", "=", True)], order="name asc")
         )
+        # Choices for the per-ticket assign forms, loaded once for every row.
+        assignable_users = (
+            request.env["res.users"]
+            .sudo()
+            .search(
+                [
+                    ("active", "=", True),
+                    ("share", "=", False),
+                    ("group_ids", "in", [ref_id(request.env, "base.group_user")]),
+                    (
+                        "group_ids",
+                        "not in",
+                        [ref_id(request.env, "base.group_system")],
+                    ),
+                ]
+            )
+        )
+        sla_policies = (
+            request.env["customer.support.sla.policy"]
+            .sudo()
+            .search([("active", "=", True)])
+        )
 
         return request.render(
             "customer_support.admin_dashboard",
@@ -325,14 +421,15 @@ class CustomerSupportAdminUsers(http.Controller):
                 "users_data": active_users_data,
                 "active_users_data": active_users_data,
                 "deactivated_users_data": deactivated_users_data,
-                "analytics": analytics,
-                "performance": performance,
                 "projects": projects,
+                "assignable_users": assignable_users,
+                "sla_policies": sla_policies,
                 "selected_project_id": selected_project_id,
                 "assignment_filter": assignment_filter,
                 "all_projects_ticket_count": all_projects_ticket_count,
                 "project_ticket_counts": project_ticket_counts,
                 "assignment_counts": assignment_counts,
+                "ticket_pager": ticket_pager,
                 "page_name": "admin_dashboard",
             },
         )
@@ -355,8 +452,7 @@ class CustomerSupportAdminUsers(http.Controller):
         Supports ?days=7|30|90 filter.
         """
         try:
-            user = request.env.user
-            if not user.has_group("base.group_system"):
+            if not request_is_admin(request):
                 return request.make_response(
                     json.dumps({"success": False, "error": "Access denied"}),
                     headers=[("Content-Type", "application/json")],
@@ -373,9 +469,8 @@ class CustomerSupportAdminUsers(http.Controller):
 
             # ── Status breakdown ─────────────────────────────────────────────
             states = ["new", "assigned", "in_progress", "resolved", "closed"]
-            status_breakdown = {
-                s: len(all_tickets.filtered(lambda t: t.state == s)) for s in states
-            }
+            state_counts = Counter(all_tickets.mapped("state"))
+            status_breakdown = {s: state_counts[s] for s in states}
 
             # ── Priority distribution (open tickets only) ─────────────────────
             open_tickets = all_tickets.filtered(
@@ -415,14 +510,15 @@ class CustomerSupportAdminUsers(http.Controller):
                 .sudo()
                 .search([("active", "=", True)])
             )
+            # One pass splits the tickets per project; grouped() keeps the
+            # subsets on the shared prefetch set.
+            no_tickets = all_tickets.browse()
+            tickets_by_project = all_tickets.grouped("project_id")
+            period_by_project = period_tickets.grouped("project_id")
             project_health = []
             for proj in projects:
-                proj_tickets = all_tickets.filtered(
-                    lambda t: t.project_id.id == proj.id
-                )
-                proj_period = period_tickets.filtered(
-                    lambda t: t.project_id.id == proj.id
-                )
+                proj_tickets = tickets_by_project.get(proj, no_tickets)
+                proj_period = period_by_project.get(proj, no_tickets)
                 total = len(proj_tickets)
                 open_count = len(
                     proj_tickets.filtered(
@@ -504,28 +600,14 @@ class CustomerSupportAdminUsers(http.Controller):
             project_health.sort(key=lambda p: p["health_score"])
 
             # ── Focal person leaderboard ──────────────────────────────────────
-            focal_persons = (
-                request.env["res.users"]
-                .sudo()
-                .search(
-                    [
-                        ("id", "not in", [1, request.env.ref("base.public_user").id]),
-                        ("active", "=", True),
-                    ]
-                )
-            )
-            focal_persons = focal_persons.filtered(
-                lambda u: u.has_group("base.group_user")
-            )
+            focal_persons = self._active_focal_persons()
 
+            tickets_by_agent = all_tickets.grouped("assigned_to")
+            period_by_agent = period_tickets.grouped("assigned_to")
             focal_leaderboard = []
             for fp in focal_persons:
-                fp_tickets = all_tickets.filtered(
-                    lambda t: t.assigned_to and t.assigned_to.id == fp.id
-                )
-                fp_period = period_tickets.filtered(
-                    lambda t: t.assigned_to and t.assigned_to.id == fp.id
-                )
+                fp_tickets = tickets_by_agent.get(fp, no_tickets)
+                fp_period = period_by_agent.get(fp, no_tickets)
                 assigned = len(fp_tickets)
                 resolved = len(
                     fp_tickets.filtered(lambda t: t.state in ["resolved", "closed"])
@@ -584,8 +666,6 @@ class CustomerSupportAdminUsers(http.Controller):
             focal_leaderboard.sort(key=lambda f: f["resolved"], reverse=True)
 
             # ── Top customers ─────────────────────────────────────────────────
-            from collections import Counter
-
             customer_counts = Counter(
                 t.customer_id.name for t in period_tickets if t.customer_id
             )
@@ -659,12 +739,10 @@ class CustomerSupportAdminUsers(http.Controller):
         auth="user",
         website=True,
     )
+    @admin_required
     def report_project(self, project_id, **kw):
         """Printable Project Health Report for a single project."""
         user = request.env.user
-        if not user.has_group("base.group_system"):
-            return werkzeug.utils.redirect("/customer_support/dashboard")
-
         days = int(kw.get("days", 30))
         since = fields.Datetime.now() - timedelta(days=days)
 
@@ -684,9 +762,8 @@ class CustomerSupportAdminUsers(http.Controller):
         )
 
         states = ["new", "assigned", "in_progress", "resolved", "closed"]
-        status_breakdown = {
-            s: len(all_tickets.filtered(lambda t: t.state == s)) for s in states
-        }
+        state_counts = Counter(all_tickets.mapped("state"))
+        status_breakdown = {s: state_counts[s] for s in states}
         priorities = ["urgent", "high", "medium", "low"]
         priority_breakdown = {
             p: len(all_tickets.filtered(lambda t: t.priority == p)) for p in priorities
@@ -770,12 +847,10 @@ class CustomerSupportAdminUsers(http.Controller):
         auth="user",
         website=True,
     )
+    @admin_required
     def report_focal_person(self, focal_id, **kw):
         """Printable Focal Person Performance Report."""
         user = request.env.user
-        if not user.has_group("base.group_system"):
-            return werkzeug.utils.redirect("/customer_support/dashboard")
-
         days = int(kw.get("days", 30))
         since = fields.Datetime.now() - timedelta(days=days)
 
@@ -874,12 +949,10 @@ class CustomerSupportAdminUsers(http.Controller):
         auth="user",
         website=True,
     )
+    @admin_required
     def report_executive(self, **kw):
         """Printable Executive Summary Report — all projects + all focal persons."""
         user = request.env.user
-        if not user.has_group("base.group_system"):
-            return werkzeug.utils.redirect("/customer_support/dashboard")
-
         days = int(kw.get("days", 30))
         since = fields.Datetime.now() - timedelta(days=days)
 
@@ -905,9 +978,14 @@ class CustomerSupportAdminUsers(http.Controller):
             .sudo()
             .search([("active", "=", True)])
         )
+        # One pass splits the tickets per project and per agent; grouped()
+        # keeps the subsets on the shared prefetch set.
+        no_tickets = all_tickets.browse()
+        tickets_by_project = all_tickets.grouped("project_id")
+        tickets_by_agent = all_tickets.grouped("assigned_to")
         project_rows = []
         for proj in projects:
-            pt = all_tickets.filtered(lambda t: t.project_id.id == proj.id)
+            pt = tickets_by_project.get(proj, no_tickets)
             tot = len(pt)
             res = len(pt.filtered(lambda t: t.state in ["resolved", "closed"]))
             br = len(pt.filtered(lambda t: t.sla_status == "breached"))
@@ -930,22 +1008,10 @@ class CustomerSupportAdminUsers(http.Controller):
             )
         project_rows.sort(key=lambda x: x["health_score"])
 
-        focal_persons = (
-            request.env["res.users"]
-            .sudo()
-            .search(
-                [
-                    ("id", "not in", [1, request.env.ref("base.public_user").id]),
-                    ("active", "=", True),
-                ]
-            )
-        )
-        focal_persons = focal_persons.filtered(lambda u: u.has_group("base.group_user"))
+        focal_persons = self._active_focal_persons()
         focal_rows = []
         for fp in focal_persons:
-            ft = all_tickets.filtered(
-                lambda t: t.assigned_to and t.assigned_to.id == fp.id
-            )
+            ft = tickets_by_agent.get(fp, no_tickets)
             tot = len(ft)
             res = len(ft.filtered(lambda t: t.state in ["resolved", "closed"]))
             br = len(ft.filtered(lambda t: t.sla_status == "breached"))
@@ -1090,7 +1156,7 @@ class CustomerSupportAdminUsers(http.Controller):
     def admin_notifications_mark_read(self, **kw):
         """Persist 'mark all read' for current admin user across sessions."""
         try:
-            if not request.env.user.has_group("base.group_system"):
+            if not request_is_admin(request):
                 return request.make_response(
                     json.dumps({"success": False, "error": "Access denied"}),
                     headers=[("Content-Type", "application/json")],
@@ -1165,28 +1231,38 @@ class CustomerSupportAdminUsers(http.Controller):
             total_breached_system = 0
             overloaded_count = 0
 
-            for user in users:
-                user_tickets = Ticket.search([("assigned_to", "=", user.id)])
-
-                assigned = len(
-                    user_tickets.filtered(lambda t: t.state in ["new", "assigned"])
-                )
-                in_progress = len(
-                    user_tickets.filtered(lambda t: t.state == "in_progress")
-                )
-                resolved = len(
-                    user_tickets.filtered(lambda t: t.state in ["resolved", "closed"])
+            # Two grouped queries for every agent instead of a ticket search
+            # per agent: counts per (agent, state), then SLA breaches per agent.
+            state_counts = {}
+            for row in Ticket.read_group(
+                [("assigned_to", "in", users.ids)],
+                ["assigned_to", "state"],
+                ["assigned_to", "state"],
+                lazy=False,
+            ):
+                per_state = state_counts.setdefault(row["assigned_to"][0], Counter())
+                per_state[row["state"]] += row["__count"]
+            breached_counts = {
+                row["assigned_to"][0]: row["assigned_to_count"]
+                for row in Ticket.read_group(
+                    [
+                        ("assigned_to", "in", users.ids),
+                        ("sla_deadline", "<", now),
+                        ("state", "not in", ["resolved", "closed"]),
+                    ],
+                    ["assigned_to"],
+                    ["assigned_to"],
                 )
-                total_open = assigned + in_progress
-                total_all = len(user_tickets)
+            }
 
-                breached = len(
-                    user_tickets.filtered(
-                        lambda t: t.sla_deadline
-                        and t.sla_deadline < now
-                        and t.state not in ["resolved", "closed"]
-                    )
-                )
+            for user in users:
+                per_state = state_counts.get(user.id, Counter())
+                assigned = per_state["new"] + per_state["assigned"]
+                in_progress = per_state["in_progress"]
+                resolved = per_state["resolved"] + per_state["closed"]
+                total_open = assigned + in_progress
+                total_all = sum(per_state.values())
+                breached = breached_counts.get(user.id, 0)
 
                 resolve_rate = (
                     round((resolved / total_all) * 100) if total_all > 0 else 0
@@ -1243,10 +1319,8 @@ class CustomerSupportAdminUsers(http.Controller):
         auth="user",
         website=True,
     )
+    @admin_required
     def admin_users_list(self, **kw):
-        user = request.env.user
-        if not user.has_group("base.group_system"):
-            return werkzeug.utils.redirect("/customer_support/dashboard")
         # Legacy route kept for backward compatibility; user management now lives
         # directly in the Admin Dashboard tab.
         return self._redirect_user_management_tab(
@@ -1263,11 +1337,9 @@ class CustomerSupportAdminUsers(http.Controller):
         auth="user",
         website=True,
     )
+    @admin_required
     def admin_create_user_form(self, **kw):
         user = request.env.user
-        if not user.has_group("base.group_system"):
-            return werkzeug.utils.redirect("/customer_support/dashboard")
-
         return request.render(
             "customer_support.admin_create_user_form",
             {
@@ -1285,88 +1357,64 @@ class CustomerSupportAdminUsers(http.Controller):
         website=True,
         csrf=True,
     )
+    @admin_required
     def admin_submit_user(self, **post):
         try:
             user = request.env.user
-            if not user.has_group("base.group_system"):
-                return werkzeug.utils.redirect("/customer_support/dashboard")
 
-            post_dict = dict(post) if not isinstance(post, dict) else post
+            name = post.get("name", "").strip()
+            email = post.get("email", "").strip()
+            password = post.get("password", "").strip()
+            user_type = post.get("user_type", "customer")
+            phone = post.get("phone", "").strip()
 
-            name = post_dict.get("name", "").strip()
-            email = post_dict.get("email", "").strip()
-            password = post_dict.get("password", "").strip()
-            user_type = post_dict.get("user_type", "customer")
-            phone = post_dict.get("phone", "").strip()
-
-            if not name:
-                return werkzeug.utils.redirect(
-                    "/customer_support/admin_dashboard/create_user?error=Name is required"
-                )
-            if not email:
-                return werkzeug.utils.redirect(
-                    "/customer_support/admin_dashboard/create_user?error=Email is required"
-                )
-            if not password:
-                return werkzeug.utils.redirect(
-                    "/customer_support/admin_dashboard/create_user?error=Password is required"
-                )
-
-            existing_user = (
-                request.env["res.users"]
-                .sudo()
-                .with_context(active_test=False)
-                .search(["|", ("login", "=", email), ("email", "=", email)], limit=1)
-            )
-            if existing_user:
-                return werkzeug.utils.redirect(
-                    "/customer_support/admin_dashboard/create_user?error=A user with this email already exists"
-                )
-
-            partner = (
-                request.env["res.partner"]
-                .sudo()
-                .create(
-                    {
-                        "name": name,
-                        "email": email,
-                        "phone": phone,
-                        "is_company": False,
-                    }
-                )
-            )
+            for field, error in _CREATE_USER_REQUIRED:
+                if not post.get(field, "").strip():
+                    return self._redirect_create_user_error(error)
 
             if user_type == "focal_person":
-                groups_to_add = [request.env.ref("base.group_user").id]
+                groups_to_add = [ref_id(request.env, "base.group_user")]
             else:
-                groups_to_add = [request.env.ref("base.group_portal").id]
+                groups_to_add = [ref_id(request.env, "base.group_portal")]
 
-            new_user = (
-                request.env["res.users"]
-                .sudo()
-                .with_context(no_reset_password=True)
-                .create(
-                    {
-                        "name": name,
-                        "login": email,
-                        "email": email,
-                        "partner_id": partner.id,
-                        "password": password,
-                        "active": True,
-                    }
+            # The unique index on res_users.login rejects duplicates; no pre-SELECT.
+            try:
+                with request.env.cr.savepoint():
+                    # res.users creates the linked partner from these values.
+                    new_user = (
+                        request.env(su=True)["res.users"]
+                        .with_context(no_reset_password=True)
+                        .create(
+                            {
+                                "name": name,
+                                "login": email,
+                                "email": email,
+                                "phone": phone,
+                                "password": password,
+                                "active": True,
+                                "group_ids": [(6, 0, groups_to_add)],
+                            }
+                        )
+                    )
+            except pg_errors.UniqueViolation:
+                return self._redirect_create_user_error(
+                    "A user with this email already exists"
                 )
-            )
-
-            if groups_to_add:
-                new_user.sudo().write({"group_ids": [(6, 0, groups_to_add)]})
 
             _logger.info(f"User created: {new_user.name} ({user_type}) by {user.name}")
 
+            # Queue the welcome mail in this transaction and let the mail queue
+            # cron deliver it, so SMTP latency stays out of the response.
             try:
                 if user_type == "customer":
-                    EmailService.send_welcome_email(email, name, password)
+                    EmailService.send_welcome_email(
+                        email, name, password, force_send=False
+                    )
                 elif user_type == "focal_person":
-                    EmailService.send_welcome_email_focal_person(email, name, password)
+                    EmailService.send_welcome_email_focal_person(
+                        email, name, password, force_send=False
+                    )
+                request.env.ref("mail.ir_cron_mail_scheduler_action").sudo()._trigger()
             except Exception as email_error:
                 _logger.error(f"Welcome email failed for {email}: {str(email_error)}")
 
@@ -1379,8 +1427,8 @@ class CustomerSupportAdminUsers(http.Controller):
 
         except Exception as e:
             _logger.exception(f"Create user error: {str(e)}")
-            return werkzeug.utils.redirect(
-                "/customer_support/admin_dashboard/create_user?error=Error creating user. Please try again."
+            return self._redirect_create_user_error(
+                "Error creating user. Please try again."
             )
 
     # =========================================================================
@@ -1393,19 +1441,17 @@ class CustomerSupportAdminUsers(http.Controller):
         auth="user",
         website=True,
     )
+    @admin_required
     def admin_edit_user_form(self, user_id, **kw):
         current_user = request.env.user
-        if not current_user.has_group("base.group_system"):
-            return werkzeug.utils.redirect("/customer_support/dashboard")
-
         edit_user = request.env["res.users"].sudo().browse(user_id)
-        if not edit_user.exists():
+        try:
+            user_type = (
+                "focal_person" if edit_user.has_group("base.group_user") else "customer"
+            )
+        except MissingError:
             return self._redirect_user_management_tab(error="User not found")
 
-        user_type = (
-            "focal_person" if edit_user.has_group("base.group_user") else "customer"
-        )
-
         return request.render(
             "customer_support.admin_edit_user_form",
             {
@@ -1425,83 +1471,67 @@ class CustomerSupportAdminUsers(http.Controller):
         website=True,
         csrf=True,
     )
+    @admin_required
     def admin_update_user(self, user_id, **post):
         try:
             current_user = request.env.user
-            if not current_user.has_group("base.group_system"):
-                return werkzeug.utils.redirect("/customer_support/dashboard")
-
-            edit_user = request.env["res.users"].sudo().browse(user_id)
-            if not edit_user.exists():
-                return self._redirect_user_management_tab(error="User not found")
-
-            post_dict = dict(post) if not isinstance(post, dict) else post
-
-            name = post_dict.get("name", "").strip()
-            email = post_dict.get("email", "").strip()
-            phone = post_dict.get("phone", "").strip()
-            user_type = post_dict.get("user_type", "customer")
-            password = post_dict.get("password", "").strip()
+            edit_user = request.env(su=True)["res.users"].browse(user_id)
 
-            if not name:
-                return werkzeug.utils.redirect(
-                    f"/customer_support/admin_dashboard/user/{user_id}/edit?error=Name is required"
-                )
-            if not email:
-                return werkzeug.utils.redirect(
-                    f"/customer_support/admin_dashboard/user/{user_id}/edit?error=Email is required"
-                )
 
-            existing_user = (
-                request.env["res.users"]
-                .sudo()
-                .search(
-                    [
-                        "|",
-                        ("login", "=", email),
-                        ("email", "=", email),
-                        ("id", "!=", user_id),
-                    ],
-                    limit=1,
-                )
-            )
-            if existing_user:
-                return werkzeug.utils.redirect(
-                    f"/customer_support/admin_dashboard/user/{user_id}/edit?error=Email already exists"
-                )
+            name = post.get("name", "").strip()
+            email = post.get("email", "").strip()
+            phone = post.get("phone", "").strip()
+            user_type = post.get("user_type", "customer")
+            password = post.get("password", "").strip()
 
-            edit_user.partner_id.sudo().write(
-                {"name": name, "email": email, "phone": phone}
-            )
+            for field, error in _EDIT_USER_REQUIRED:
+                if not post.get(field, "").strip():
+                    return self._redirect_edit_user_error(user_id, error)
 
-            update_vals = {"name": name, "login": email, "email": email}
+            # name, email and phone live on the partner; res.users delegates
+            # them through _inherits, so one write updates both records.
+            update_vals = {"name": name, "login": email, "email": email, "phone": phone}
             if password:
                 update_vals["password"] = password
 
-            if user_type == "focal_person":
-                groups_to_add = [request.env.ref("base.group_user").id]
-                groups_to_remove = [request.env.ref("base.group_portal").id]
-            else:
-                groups_to_add = [request.env.ref("base.group_portal").id]
-                groups_to_remove = [request.env.ref("base.group_user").id]
+            # Only touch group_ids when the role actually changes; every group
+            # write recomputes the user's implied groups.
+            current_type = (
+                "focal_person" if edit_user.has_group("base.group_user") else "customer"
+            )
+            if current_type != user_type:
+                if user_type == "focal_person":
+                    group_to_add = ref_id(request.env, "base.group_user")
+                    group_to_remove = ref_id(request.env, "base.group_portal")
+                else:
+                    group_to_add = ref_id(request.env, "base.group_portal")
+                    group_to_remove = ref_id(request.env, "base.group_user")
 
-            update_vals["group_ids"] = [
-                (4, groups_to_add[0]),
-                (3, groups_to_remove[0]),
-            ]
+                # One replace command with the final set; the user's other
+                # groups are carried over unchanged.
+                current_gids = set(edit_user.group_ids.ids)
+                new_gids = (current_gids - {group_to_remove}) | {group_to_add}
+                if new_gids != current_gids:
+                    update_vals["group_ids"] = [(6, 0, sorted(new_gids))]
+
+            # The unique index on res_users.login rejects duplicates; no pre-SELECT.
+            try:
+                with request.env.cr.savepoint():
+                    edit_user.write(update_vals)
+            except pg_errors.UniqueViolation:
+                return self._redirect_edit_user_error(user_id, "Email already exists")
 
-            edit_user.sudo().write(update_vals)
             _logger.info(f"User updated: {edit_user.name} by {current_user.name}")
 
             return self._redirect_user_management_tab(
                 success="User updated successfully"
             )
 
+        except MissingError:
+            return self._redirect_user_management_tab(error="User not found")
         except Exception as e:
             _logger.exception(f"Update user error: {str(e)}")
-            return werkzeug.utils.redirect(
-                f"/customer_support/admin_dashboard/user/{user_id}/edit?error=Error updating user"
-            )
+            return self._redirect_edit_user_error(user_id, "Error updating user")
 
     # =========================================================================
     # TOGGLE USER ACTIVE / INACTIVE
@@ -1515,15 +1545,11 @@ class CustomerSupportAdminUsers(http.Controller):
         website=True,
         csrf=True,
     )
+    @admin_required
     def admin_toggle_user_active(self, user_id, **post):
         try:
             current_user = request.env.user
-            if not current_user.has_group("base.group_system"):
-                return werkzeug.utils.redirect("/customer_support/dashboard")
-
-            edit_user = request.env["res.users"].sudo().browse(user_id)
-            if not edit_user.exists():
-                return self._redirect_user_management_tab(error="User not found")
+            edit_user = request.env(su=True)["res.users"].browse(user_id)
 
             if edit_user.id == current_user.id:
                 return self._redirect_user_management_tab(
@@ -1531,7 +1557,7 @@ class CustomerSupportAdminUsers(http.Controller):
                 )
 
             new_status = not edit_user.active
-            edit_user.sudo().write({"active": new_status})
+            edit_user.write({"active": new_status})
             status_text = "activated" if new_status else "deactivated"
             _logger.info(f"User {status_text}: {edit_user.name} by {current_user.name}")
 
@@ -1539,6 +1565,8 @@ class CustomerSupportAdminUsers(http.Controller):
                 success=f"User {status_text} successfully"
             )
 
+        except MissingError:
+            return self._redirect_user_management_tab(error="User not found")
         except Exception as e:
             _logger.exception(f"Toggle user active error: {str(e)}")
             return self._redirect_user_management_tab(
@@ -1557,15 +1585,11 @@ class CustomerSupportAdminUsers(http.Controller):
         website=True,
         csrf=True,
     )
+    @admin_required
     def admin_delete_user(self, user_id, **post):
         try:
             current_user = request.env.user
-            if not current_user.has_group("base.group_system"):
-                return werkzeug.utils.redirect("/customer_support/dashboard")
-
-            edit_user = request.env["res.users"].sudo().browse(user_id)
-            if not edit_user.exists():
-                return self._redirect_user_management_tab(error="User not found")
+            edit_user = request.env(su=True)["res.users"].browse(user_id)
 
             if edit_user.id == current_user.id:
                 return self._redirect_user_management_tab(
@@ -1573,13 +1597,15 @@ class CustomerSupportAdminUsers(http.Controller):
                 )
 
             user_name = edit_user.name
-            edit_user.sudo().write({"active": False})
+            edit_user.write({"active": False})
             _logger.info(f"User archived: {user_name} by {current_user.name}")
 
             return self._redirect_user_management_tab(
                 success="User deleted successfully"
             )
 
+        except MissingError:
+            return self._redirect_user_management_tab(error="User not found")
         except Exception as e:
             _logger.exception(f"Delete user error: {str(e)}")
             return self._redirect_user_management_tab(error="Error deleting user")
@@ -1591,7 +1617,7 @@ class CustomerSupportAdminUsers(http.Controller):
         csrf=False,
     )
     def user_detail(self, user_id, **kw):
-        if not request.env.user.has_group("base.group_system"):
+        if not request_is_admin(request):
             return {"error": "Access denied"}
         try:
             user = (
@@ -1603,11 +1629,12 @@ class CustomerSupportAdminUsers(http.Controller):
             if not user.exists():
                 return {"error": "User not found"}
 
-            if user.has_group("base.group_system"):
+            is_admin, is_portal, is_internal = user_roles(user)
+            if is_admin:
                 role = "Admin"
-            elif user.has_group("base.group_user"):
+            elif is_internal:
                 role = "Focal Person"
-            elif user.has_group("base.group_portal"):
+            elif is_portal:
                 role = "Customer"
             else:
                 role = "User"
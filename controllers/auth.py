@@ -17,6 +17,8 @@ from urllib.parse import urlsplit
 from odoo import http
 from odoo.http import request
 import werkzeug
+from .access import login_redirect, role_dashboard_url
+from .page_cache import render_static_page
 
 _logger = logging.getLogger(__name__)
 
@@ -32,22 +34,24 @@ class CustomerSupportAuth(http.Controller):
     # LANDING PAGE
     # =========================================================================
 
-    @http.route("/customer_support", type="http", auth="public", website=True)
+    @http.route(
+        "/customer_support",
+        type="http",
+        auth="public",
+        website=True,
+        readonly=True,
+    )
     def landing_page(self, **kw):
         """
         Landing Page - Always shown. If the user is already logged in,
         the CTA button changes to 'Go to Dashboard' instead of 'Get Started'.
         """
         user = request.env.user
-        public_user = request.env.ref("base.public_user")
-        dashboard_url = ""
-        if user and user.id != public_user.id and user.active:
-            if user.has_group("base.group_system"):
-                dashboard_url = "/customer_support/admin_dashboard"
-            elif user.has_group("base.group_user"):
-                dashboard_url = "/customer_support/support_dashboard"
-            elif user.has_group("base.group_portal"):
-                dashboard_url = "/customer_support/dashboard"
+        if user._is_public():
+            # Anonymous visitors all get the same markup
+            return render_static_page("customer_support.landing_page", {"dashboard_url": ""})
+
+        dashboard_url = role_dashboard_url(user) if user.active else ""
 
         response = request.render(
             "customer_support.landing_page",
@@ -64,7 +68,13 @@ class CustomerSupportAuth(http.Controller):
     # LOGIN
     # =========================================================================
 
-    @http.route("/customer_support/login", type="http", auth="public", website=True)
+    @http.route(
+        "/customer_support/login",
+        type="http",
+        auth="public",
+        website=True,
+        readonly=True,
+    )
     def support_login(self, **kw):
         """
         Login Page - Renders the custom login form
@@ -72,22 +82,19 @@ class CustomerSupportAuth(http.Controller):
         Access: Public (no login required) — redirects already-authenticated users
         """
         user = request.env.user
-        public_user = request.env.ref("base.public_user")
         # Allow email links to force showing the login page even if a different
         # user is currently authenticated in the browser by supplying
         # ?force_login=1 — this prevents accidental access as an admin/support
         # when a customer clicks an email link from a shared browser.
         force_login = str(kw.get("force_login", "")).lower() in ("1", "true", "yes")
-        if user and user.id != public_user.id and user.active and not force_login:
+        if not user._is_public() and user.active and not force_login:
             # User is already logged in — redirect to their dashboard
-            if user.has_group("base.group_system"):
-                return werkzeug.utils.redirect("/customer_support/admin_dashboard")
-            elif user.has_group("base.group_user"):
-                return werkzeug.utils.redirect("/customer_support/support_dashboard")
-            elif user.has_group("base.group_portal"):
-                return werkzeug.utils.redirect("/customer_support/dashboard")
+            dashboard_url = role_dashboard_url(user)
+            if dashboard_url:
+                return werkzeug.utils.redirect(dashboard_url)
 
         # Accept both ?next= (from our ir.http override) and ?redirect= (legacy)
+        # The form carries a session-bound CSRF token, so this page is never cached.
         next_url = kw.get("next", "") or kw.get("redirect", "")
         response = request.render(
             "customer_support.portal_login_page",
@@ -131,42 +138,56 @@ class CustomerSupportAuth(http.Controller):
             # ← ADDED: read the redirect URL submitted as a hidden form field
             redirect_url = post.get("redirect", "").strip()
 
-            _logger.info(f"Login attempt for email/login: {email}")
+            _logger.info("Login attempt for email/login: %s", email)
 
             # Validate that both fields are provided
             if not email or not password:
-                return werkzeug.utils.redirect(
-                    "/customer_support/login?error=Email and password are required"
-                )
+                return login_redirect("Email and password are required")
 
             # Ensure a database connection is available
             db = request.session.db
             if not db:
-                return werkzeug.utils.redirect(
-                    "/customer_support/login?error=Database connection error"
-                )
+                return login_redirect("Database connection error")
 
-            # Search for matching users by login OR email field
+            # Resolve a single active candidate in one query: an exact login
+            # match wins over an email match, so the password is hashed at
+            # most once. The email lives on the user's partner. A second row
+            # is fetched only to notice emails shared by several accounts.
             uid = False
-            users = (
-                request.env["res.users"]
-                .sudo()
-                .search(["|", ("login", "=", email), ("email", "=", email)])
+            request.env.cr.execute(
+                """
+                SELECT u.login, u.login = %s AS exact
+                FROM res_users u
+                JOIN res_partner p ON p.id = u.partner_id
+                WHERE u.active AND (u.login = %s OR p.email = %s)
+                ORDER BY exact DESC, u.id
+                LIMIT 2
+            """,
+                [email, email, email],
             )
+            rows = request.env.cr.fetchall()
 
-            # Try authenticating each matching user until one succeeds
-            for u in users:
+            if rows:
+                login, exact = rows[0]
+                if not exact and len(rows) > 1:
+                    _logger.warning(
+                        "Login email %s is shared by several users, trying %s",
+                        email,
+                        login,
+                    )
                 try:
                     auth_info = request.session.authenticate(
                         request.env,
-                        {"type": "password", "login": u.login, "password": password},
+                        {"type": "password", "login": login, "password": password},
                     )
                     uid = auth_info.get("uid") if auth_info else False
                 except Exception as ex:
-                    _logger.exception(f"authenticate raised for user {u.login}: {ex}")
+                    _logger.exception("authenticate raised for user %s: %s", login, ex)
                     uid = False
-                if uid:
-                    break
+            else:
+                # Spend the same hashing time as a real check so unknown
+                # addresses cannot be told apart by response time.
+                request.env["res.users"]._crypt_context().dummy_verify()
 
             if uid:
                 user = request.env["res.users"].browse(uid)
@@ -174,9 +195,7 @@ class CustomerSupportAuth(http.Controller):
                 # Block inactive accounts immediately
                 if not user.active:
                     request.session.logout()
-                    return werkzeug.utils.redirect(
-                        "/customer_support/login?error=Your account is inactive"
-                    )
+                    return login_redirect("Your account is inactive")
 
                 # Route to the correct dashboard based on the user's role
                 # Validate redirect_url — allow only safe in-portal relative paths.
@@ -195,38 +214,21 @@ class CustomerSupportAuth(http.Controller):
                     ):
                         safe_redirect = redirect_url
 
-                if user.has_group("base.group_system"):
-                    request.session["customer_support_login"] = True
-                    destination = safe_redirect or "/customer_support/admin_dashboard"
-                    return werkzeug.utils.redirect(destination)
-
-                elif user.has_group("base.group_portal"):
-                    request.session["customer_support_login"] = True
-                    destination = safe_redirect or "/customer_support/dashboard"
-                    return werkzeug.utils.redirect(destination)
-
-                elif user.has_group("base.group_user"):
+                dashboard_url = role_dashboard_url(user)
+                if dashboard_url:
                     request.session["customer_support_login"] = True
-                    destination = safe_redirect or "/customer_support/support_dashboard"
-                    return werkzeug.utils.redirect(destination)
+                    return werkzeug.utils.redirect(safe_redirect or dashboard_url)
 
-                else:
-                    # Authenticated but no recognised role — deny access
-                    request.session.logout()
-                    return werkzeug.utils.redirect(
-                        "/customer_support/login?error=You do not have access to the customer support portal"
-                    )
+                # Authenticated but no recognised role — deny access
+                request.session.logout()
+                return login_redirect("You do not have access to the customer support portal")
 
             # No user matched the supplied credentials
-            return werkzeug.utils.redirect(
-                "/customer_support/login?error=Invalid email or password"
-            )
+            return login_redirect("Invalid email or password")
 
         except Exception as e:
-            _logger.error(f"Login processing error: {str(e)}")
-            return werkzeug.utils.redirect(
-                "/customer_support/login?error=An error occurred during login. Please try again."
-            )
+            _logger.error("Login processing error: %s", e)
+            return login_redirect("An error occurred during login. Please try again.")
 
     # =========================================================================
     # LOGOUT
@@ -247,7 +249,7 @@ class CustomerSupportAuth(http.Controller):
             )
             return response
         except Exception as e:
-            _logger.error(f"Logout error: {str(e)}")
+            _logger.error("Logout error: %s", e)
             response = werkzeug.utils.redirect("/customer_support/login?from_logout=1")
             response.headers["Cache-Control"] = (
                 "no-store, no-cache, must-revalidate, max-age=0"
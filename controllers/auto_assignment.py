@@ -4,6 +4,7 @@ from datetime import timedelta
 
 from odoo import http, fields
 from odoo.http import request
+from .access import request_is_admin
 
 
 class AutoAssignmentController(http.Controller):
@@ -28,7 +29,7 @@ class AutoAssignmentController(http.Controller):
                 },
                 status=401,
             )
-        if not request.env.user.has_group("base.group_system"):
+        if not request_is_admin(request):
             return self._json_resp(
                 {"success": False, "error": "Access denied."}, status=403
             )
@@ -5,12 +5,28 @@ import logging
 from odoo import http
 from odoo.http import request
 from ..services.rag_chatbot import ChatBotBackend, GeneralChatBackend
+from .page_cache import render_static_page
 
 _logger = logging.getLogger(__name__)
 
-# Global bot instances (one per Odoo worker)
-support_bot = ChatBotBackend()
-general_bot = GeneralChatBackend()
+# Bot instances, created on first use and then kept for the worker's lifetime.
+# Both talk to Ollama through the shared pooled session in rag_chatbot.
+_support_bot = None
+_general_bot = None
+
+
+def _get_support_bot():
+    global _support_bot
+    if _support_bot is None:
+        _support_bot = ChatBotBackend()
+    return _support_bot
+
+
+def _get_general_bot():
+    global _general_bot
+    if _general_bot is None:
+        _general_bot = GeneralChatBackend()
+    return _general_bot
 
 
 class CustomerSupportChatbot(http.Controller):
@@ -31,7 +47,7 @@ class CustomerSupportChatbot(http.Controller):
         user_id = user.id
 
         try:
-            intent, content = support_bot.send_message(
+            intent, content = _get_support_bot().send_message(
                 user_id=user_id,
                 user_message=message.strip(),
                 odoo_env=request.env,
@@ -66,12 +82,12 @@ class CustomerSupportChatbot(http.Controller):
 
     @http.route("/customer_support/chatbot/clear", type="jsonrpc", auth="user")
     def chatbot_clear(self, **kw):
-        support_bot.clear_history(request.env.user.id)
+        _get_support_bot().clear_history(request.env.user.id)
         return {"success": True}
 
     @http.route("/customer_support/chatbot/status", type="jsonrpc", auth="user")
     def chatbot_status(self, **kw):
-        online = support_bot.is_online()
+        online = _get_support_bot().is_online()
         doc_count = (
             request.env["dc.knowledge.document"]
             .sudo()
@@ -84,10 +100,10 @@ class CustomerSupportChatbot(http.Controller):
 
     # ── GENERAL / FAQ CHATBOT (uses your existing landing_chat interface) ─────
 
-    @http.route("/dragon-chat", type="http", auth="public")
+    @http.route("/dragon-chat", type="http", auth="public", website=True)
     def faq_chat_page(self, **kw):
         """Public general / FAQ chat page – loads your landing_chat template"""
-        return request.render("customer_support.landing_chat")
+        return render_static_page("customer_support.landing_chat")
 
     @http.route("/dragon-chat/message", type="jsonrpc", auth="public", website=True, csrf=False)
     def faq_chat_message(self, message, **kw):
@@ -97,7 +113,7 @@ class CustomerSupportChatbot(http.Controller):
         user_id = request.env.user.id if not request.env.user._is_public() else "guest"
 
         try:
-            intent, reply = general_bot.send_message(
+            intent, reply = _get_general_bot().send_message(
                 user_id=user_id,
                 user_message=message.strip(),
                 odoo_env=request.env,
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+Response Compression
+====================
+Gzip for the heavier portal HTML pages, for deployments where no reverse
+proxy compresses responses. Place ``@gzip_response`` directly below
+``@http.route``.
+"""
+
+import functools
+import gzip
+
+from odoo.http import request
+
+GZIP_MIN_SIZE = 1024
+GZIP_LEVEL = 5
+
+
+def gzip_response(handler):
+    """Gzip the handler's HTML response when the client accepts it."""
+
+    @functools.wraps(handler)
+    def wrapper(*args, **kwargs):
+        response = handler(*args, **kwargs)
+        if (
+            response.status_code != 200
+            or response.mimetype != "text/html"
+            or "Content-Encoding" in response.headers
+            or "gzip" not in request.httprequest.accept_encodings
+        ):
+            return response
+
+        # request.render() is lazy; render now so the body can be compressed
+        if getattr(response, "is_qweb", False):
+            response.flatten()
+        data = response.get_data()
+        if len(data) < GZIP_MIN_SIZE:
+            return response
+
+        response.set_data(gzip.compress(data, compresslevel=GZIP_LEVEL))
+        response.headers["Content-Encoding"] = "gzip"
+        response.vary.add("Accept-Encoding")
+        return response
+
+    return wrapper
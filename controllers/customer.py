@@ -1,46 +1,49 @@
 # -*- coding: utf-8 -*-
-import base64
 import json
 import logging
+from collections import Counter
 from odoo import http, fields
 from odoo.http import request
 from datetime import datetime, timedelta
 import werkzeug
+from .access import login_redirect, request_is_admin
+from .compression import gzip_response
 
 _logger = logging.getLogger(__name__)
 
 
 class CustomerSupportCustomer(http.Controller):
 
-    @http.route("/customer_support/dashboard", type="http", auth="user", website=True)
+    @http.route(
+        "/customer_support/dashboard",
+        type="http",
+        auth="user",
+        website=True,
+        readonly=True,
+    )
+    @gzip_response
     def support_dashboard(self, **kw):
         try:
             user = request.env.user
-            if user.id == request.env.ref("base.public_user").id:
-                return werkzeug.utils.redirect(
-                    "/customer_support/login?error=Please login to access dashboard"
-                )
-            if user.has_group("base.group_system"):
+            if request_is_admin(request):
                 return werkzeug.utils.redirect("/customer_support/admin_dashboard")
-            tickets = (
-                request.env["customer.support"]
-                .search([("customer_id", "=", user.partner_id.id)])
-                .sorted(key=lambda r: r.create_date, reverse=True)
+            # The portal dashboard only renders per-state counts, never the
+            # tickets themselves.
+            groups = request.env["customer.support"].read_group(
+                [("customer_id", "=", user.partner_id.id)], ["state"], ["state"]
             )
+            state_counts = {row["state"]: row["state_count"] for row in groups}
             ticket_counts = {
-                "new": len(tickets.filtered(lambda t: t.state == "new")),
-                "in_progress": len(
-                    tickets.filtered(lambda t: t.state == "in_progress")
-                ),
-                "resolved": len(tickets.filtered(lambda t: t.state == "resolved")),
-                "closed": len(tickets.filtered(lambda t: t.state == "closed")),
-                "total": len(tickets),
+                "new": state_counts.get("new", 0),
+                "in_progress": state_counts.get("in_progress", 0),
+                "resolved": state_counts.get("resolved", 0),
+                "closed": state_counts.get("closed", 0),
+                "total": sum(state_counts.values()),
             }
             response = request.render(
                 "customer_support.portal_dashboard",
                 {
                     "user": user,
-                    "tickets": tickets,
                     "ticket_counts": ticket_counts,
                     "analytics": {},
                     "performance": {},
@@ -50,39 +53,23 @@ class CustomerSupportCustomer(http.Controller):
             response.headers["Cache-Control"] = "no-store, no-cache, must-revalidate, max-age=0"
             return response
         except Exception as e:
-            _logger.error(f"Dashboard error: {str(e)}")
-            return werkzeug.utils.redirect(
-                "/customer_support/login?error=Error loading dashboard"
-            )
+            _logger.error("Dashboard error: %s", e)
+            return login_redirect("Error loading dashboard")
 
     @http.route(
-        "/customer_support/create_ticket", type="http", auth="user", website=True
+        "/customer_support/create_ticket",
+        type="http",
+        auth="user",
+        website=True,
+        readonly=True,
     )
+    @gzip_response
     def create_ticket_form(self, **kw):
         try:
-            user = request.env.user
-            if user.id == request.env.ref("base.public_user").id:
-                return werkzeug.utils.redirect(
-                    "/customer_support/login?error=Please login"
-                )
-            projects = (
-                request.env["customer_support.project"]
-                .sudo()
-                .search([("active", "=", True)])
-            )
-            response = request.render(
-                "customer_support.create_ticket_form",
-                {
-                    "user": user,
-                    "projects": projects,
-                    "error": kw.get("error", ""),
-                    "page_name": "create_ticket",
-                },
-            )
-            response.headers["Cache-Control"] = "no-store, no-cache, must-revalidate, max-age=0"
-            return response
+            errors = [kw["error"]] if kw.get("error") else []
+            return self._render_ticket_form(errors=errors)
         except Exception as e:
-            _logger.error(f"Create ticket form error: {str(e)}")
+            _logger.error("Create ticket form error: %s", e)
             return werkzeug.utils.redirect("/customer_support/dashboard")
 
     @http.route(
@@ -97,41 +84,23 @@ class CustomerSupportCustomer(http.Controller):
         try:
             user = request.env.user
 
-            _logger.info(f"POST data type: {type(post)}")
-
-            # Robust post data normalization
-            post_dict = {}
-            if hasattr(post, "items"):
-                post_dict = dict(post)
-            elif isinstance(post, (list, tuple)):
-                post_dict = dict(post)
-            else:
-                try:
-                    post_dict = dict(post)
-                except Exception as conv_err:
-                    _logger.error(
-                        f"Cannot convert post to dict: {type(post)}, {conv_err}"
-                    )
-                    return werkzeug.utils.redirect(
-                        "/customer_support/create_ticket?error=Invalid form data"
-                    )
-
-            subject = post_dict.get("subject", "").strip()
-            description = post_dict.get("description", "").strip()
-            project_id = post_dict.get("project_id")
+            subject = post.get("subject", "").strip()
+            description = post.get("description", "").strip()
+            project_id = post.get("project_id")
 
+            # Report every problem at once and re-render in place, keeping
+            # what the customer already typed.
+            errors = []
             if not subject:
-                return werkzeug.utils.redirect(
-                    "/customer_support/create_ticket?error=Subject is required"
-                )
+                errors.append("Subject is required")
             if not description:
-                return werkzeug.utils.redirect(
-                    "/customer_support/create_ticket?error=Description is required"
-                )
+                errors.append("Description is required")
             if not project_id:
-                return werkzeug.utils.redirect(
-                    "/customer_support/create_ticket?error=Project is required"
-                )
+                errors.append("Project is required")
+            elif not str(project_id).isdigit():
+                errors.append("Invalid project")
+            if errors:
+                return self._render_ticket_form(errors=errors, form=post)
 
             ticket = (
                 request.env["customer.support"]
@@ -140,7 +109,7 @@ class CustomerSupportCustomer(http.Controller):
                     {
                         "subject": subject,
                         "description": description,
-                        "priority": post_dict.get("priority", "medium"),
+                        "priority": post.get("priority", "medium"),
                         "customer_id": user.partner_id.id,
                         "project_id": int(project_id),
                         "state": "new",
@@ -148,39 +117,46 @@ class CustomerSupportCustomer(http.Controller):
                 )
             )
 
-            # Handle attachments
+            # Handle attachments — collected first, then created in one call
             try:
                 if hasattr(request, "httprequest") and hasattr(
                     request.httprequest, "files"
                 ):
-                    for file_key in request.httprequest.files:
-                        uploaded_file = request.httprequest.files[file_key]
-                        if uploaded_file and uploaded_file.filename:
-                            file_data = uploaded_file.read()
-                            if file_data:
-                                request.env["ir.attachment"].sudo().create(
-                                    {
-                                        "name": uploaded_file.filename,
-                                        "type": "binary",
-                                        "datas": base64.b64encode(file_data).decode(
-                                            "utf-8"
-                                        ),
-                                        "res_model": "customer.support",
-                                        "res_id": ticket.id,
-                                        "mimetype": uploaded_file.content_type
-                                        or "application/octet-stream",
-                                    }
-                                )
-                                _logger.info(
-                                    f"Attachment added: {uploaded_file.filename}"
-                                )
+                    attachment_vals = []
+                    for uploaded_file in request.httprequest.files.values():
+                        if not (uploaded_file and uploaded_file.filename):
+                            continue
+                        # "raw" takes the bytes as-is; no base64 copy
+                        file_data = uploaded_file.stream.read()
+                        if file_data:
+                            attachment_vals.append(
+                                {
+                                    "name": uploaded_file.filename,
+                                    "type": "binary",
+                                    "raw": file_data,
+                                    "res_model": "customer.support",
+                                    "res_id": ticket.id,
+                                    "mimetype": uploaded_file.content_type
+                                    or "application/octet-stream",
+                                }
+                            )
+                    if attachment_vals:
+                        request.env["ir.attachment"].sudo().create(attachment_vals)
+                        _logger.info(
+                            "%s attachment(s) added to %s",
+                            len(attachment_vals),
+                            ticket.name,
+                        )
             except Exception as attach_err:
                 _logger.warning(
-                    f"Attachment processing error (ticket still created): {attach_err}"
+                    "Attachment processing error (ticket still created): %s", attach_err
                 )
 
             _logger.info(
-                f"Ticket created: {ticket.name} by {user.name} for project {project_id}"
+                "Ticket created: %s by %s for project %s",
+                ticket.name,
+                user.name,
+                project_id,
             )
 
             return werkzeug.utils.redirect(
@@ -188,11 +164,32 @@ class CustomerSupportCustomer(http.Controller):
             )
 
         except Exception as e:
-            _logger.exception(f"Submit ticket error: {str(e)}")
+            _logger.exception("Submit ticket error: %s", e)
             return werkzeug.utils.redirect(
                 "/customer_support/create_ticket?error=Error creating ticket. Please try again."
             )
 
+    def _render_ticket_form(self, errors=None, form=None):
+        """Render the create-ticket form, optionally with errors and prefilled values."""
+        # The project picker only needs id and name.
+        projects = (
+            request.env["customer_support.project"]
+            .sudo()
+            .search_read([("active", "=", True)], ["id", "name"], order="name")
+        )
+        response = request.render(
+            "customer_support.create_ticket_form",
+            {
+                "user": request.env.user,
+                "projects": projects,
+                "errors": errors or [],
+                "form": form or {},
+                "page_name": "create_ticket",
+            },
+        )
+        response.headers["Cache-Control"] = "no-store, no-cache, must-revalidate, max-age=0"
+        return response
+
     # =========================================================================
     # CUSTOMER NOTIFICATIONS — fetch unread
     # =========================================================================
@@ -270,7 +267,7 @@ class CustomerSupportCustomer(http.Controller):
             )
 
         except Exception as e:
-            _logger.error(f"Customer notifications error: {e}")
+            _logger.error("Customer notifications error: %s", e)
             return request.make_response(
                 json.dumps({"success": False, "notifications": [], "count": 0}),
                 headers=[("Content-Type", "application/json")],
@@ -307,7 +304,7 @@ class CustomerSupportCustomer(http.Controller):
             )
 
         except Exception as e:
-            _logger.error(f"Mark notifications read error: {e}")
+            _logger.error("Mark notifications read error: %s", e)
             return request.make_response(
                 json.dumps({"success": False}),
                 headers=[("Content-Type", "application/json")],
@@ -372,15 +369,12 @@ class CustomerSupportCustomer(http.Controller):
             )
 
             # ── Status breakdown ─────────────────────────────────────────
+            state_counts = Counter(period_tickets.mapped("state"))
             status_data = {
-                "New": len(period_tickets.filtered(lambda t: t.state == "new")),
-                "In Progress": len(
-                    period_tickets.filtered(lambda t: t.state == "in_progress")
-                ),
-                "Resolved": len(
-                    period_tickets.filtered(lambda t: t.state == "resolved")
-                ),
-                "Closed": len(period_tickets.filtered(lambda t: t.state == "closed")),
+                "New": state_counts["new"],
+                "In Progress": state_counts["in_progress"],
+                "Resolved": state_counts["resolved"],
+                "Closed": state_counts["closed"],
             }
 
             # ── Priority breakdown ────────────────────────────────────────
@@ -462,7 +456,7 @@ class CustomerSupportCustomer(http.Controller):
             )
 
         except Exception as e:
-            _logger.error(f"Customer reporting error: {e}")
+            _logger.error("Customer reporting error: %s", e)
             return request.make_response(
                 json.dumps({"success": False, "error": str(e)}),
                 headers=[("Content-Type", "application/json")],
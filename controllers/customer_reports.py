@@ -7,6 +7,7 @@ import time
 from datetime import datetime
 from odoo import http
 from odoo.http import request
+from .access import request_is_admin
 
 _logger = logging.getLogger(__name__)
 _tlog = logging.getLogger("customer_support.timing")
@@ -55,7 +56,7 @@ class CustomerReportsController(http.Controller):
                 with open(_FWD_TIMING_LOG, "a") as _f:
                     _f.write(f"[{time.time()-t0:.3f}s] {msg}\n")
 
-            if not request.env.user.has_group("base.group_system"):
+            if not request_is_admin(request):
                 _flog("BLOCKED: not admin")
                 return {"error": "Access denied"}
             _flog("A: group check done")
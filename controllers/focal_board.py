@@ -45,6 +45,8 @@ from odoo import http
 from odoo.http import request
 import werkzeug
 from ..services.email_service import EmailService
+from .access import request_is_admin
+from .ticket_actions import VISIBLE_MESSAGE_TYPES
 
 _CSRF_PLACEHOLDER = None  # csrf token added via request at render time
 
@@ -143,7 +145,7 @@ def _build_task_dict(task):
 
 def _require_focal(user):
     """Return True if user is a valid internal (focal) user, False otherwise."""
-    if user.id == request.env.ref("base.public_user").id:
+    if user._is_public():
         return False
     if user.has_group("base.group_portal"):
         return False
@@ -180,7 +182,7 @@ def _conversation_messages(ticket, user, limit=80):
             [
                 ("model", "=", "customer.support"),
                 ("res_id", "=", ticket.id),
-                ("message_type", "in", ["comment", "notification"]),
+                ("message_type", "in", VISIBLE_MESSAGE_TYPES),
                 ("subtype_id.internal", "=", False),
             ],
             order="date asc",
@@ -218,9 +220,8 @@ class FocalBoardController(http.Controller):
         """
         try:
             user = request.env.user
-            public_user_id = request.env.ref('base.public_user').id
             # Logged-in internal focal users
-            if user and user.id != public_user_id and _require_focal(user):
+            if _require_focal(user):
                 return True
 
             # Public access via token
@@ -256,7 +257,7 @@ class FocalBoardController(http.Controller):
 
         if not _require_focal(user):
             return werkzeug.utils.redirect("/customer_support/dashboard")
-        if user.has_group("base.group_system"):
+        if request_is_admin(request):
             return werkzeug.utils.redirect("/customer_support/admin_dashboard")
 
         try:
@@ -1120,9 +1121,8 @@ class FocalBoardController(http.Controller):
                 return {"error": "Access denied"}
 
             user = request.env.user
-            public_user_id = request.env.ref("base.public_user").id
             poster_name = (kw.get("poster_name") or "").strip()
-            author_name = poster_name if (user.id == public_user_id and poster_name) else None
+            author_name = poster_name if (user._is_public() and poster_name) else None
 
             comment = request.env["customer_support.ticket.comment"].sudo().create({
                 "ticket_id": ticket_id,
@@ -1495,7 +1495,7 @@ class FocalBoardController(http.Controller):
                 return {"error": "Task not found"}
 
             # Checklist editing is focal-only.
-            if request.env.user.id == request.env.ref('base.public_user').id or not _require_focal(request.env.user):
+            if not _require_focal(request.env.user):
                 return {"error": "Access denied"}
 
             last = request.env["customer_support.task.checklist"].sudo().search(
@@ -1529,7 +1529,7 @@ class FocalBoardController(http.Controller):
             item = request.env["customer_support.task.checklist"].sudo().browse(item_id)
             if not item.exists():
                 return {"error": "Item not found"}
-            if request.env.user.id == request.env.ref('base.public_user').id or not _require_focal(request.env.user):
+            if not _require_focal(request.env.user):
                 return {"error": "Access denied"}
             item.write({"is_done": not item.is_done})
             if item.is_done:
@@ -1553,7 +1553,7 @@ class FocalBoardController(http.Controller):
             item = request.env["customer_support.task.checklist"].sudo().browse(item_id)
             if not item.exists():
                 return {"error": "Item not found"}
-            if request.env.user.id == request.env.ref('base.public_user').id or not _require_focal(request.env.user):
+            if not _require_focal(request.env.user):
                 return {"error": "Access denied"}
             item.unlink()
             return {"success": True}
@@ -1582,12 +1582,12 @@ class FocalBoardController(http.Controller):
 
             user = request.env.user
             author_name = (kw.get("author_name") or "").strip()
-            if user.id != request.env.ref("base.public_user").id:
+            if not user._is_public():
                 author_name = user.name
 
             note = request.env["customer_support.task.note"].sudo().create({
                 "task_id": task.id,
-                "user_id": user.id if user.id != request.env.ref("base.public_user").id else False,
+                "user_id": user.id if not user._is_public() else False,
                 "author_name": author_name or False,
                 "message": message,
             })
@@ -1596,7 +1596,7 @@ class FocalBoardController(http.Controller):
                 task.ticket_id.id,
                 "board_task_note",
                 f'{author_name or "Board Member"} added a resolving note to task "{task.name}"',
-                actor=user if user.id != request.env.ref("base.public_user").id else None,
+                actor=user if not user._is_public() else None,
                 detail=message[:120],
             )
 
@@ -3,6 +3,7 @@ import logging
 import pytz
 from odoo import http
 from odoo.http import request
+from .access import request_is_admin
 
 _logger = logging.getLogger(__name__)
 
@@ -18,7 +19,7 @@ class GeneralSettingsController(http.Controller):
     )
     def save_general_settings(self, **kw):
         try:
-            if not request.env.user.has_group("base.group_system"):
+            if not request_is_admin(request):
                 return {"error": "Access denied"}
 
             system_name = (kw.get("system_name") or "").strip()
@@ -8,14 +8,172 @@ Handles all ticket message operations:
 - Delete messages (author or admin)
 """
 
+import functools
 import json
 import logging
+import time
+from urllib.parse import urlencode
 from odoo import http
+from odoo.exceptions import MissingError
 from odoo.http import request
+from odoo.tools import html_sanitize
+from .access import request_is_admin
+
+try:
+    import orjson
+except ImportError:  # optional, the stdlib encoder is used instead
+    orjson = None
 
 _logger = logging.getLogger(__name__)
 
 
+def _encode(payload):
+    """Serialize ``payload`` to JSON bytes, with orjson when available."""
+    return orjson.dumps(payload) if orjson else json.dumps(payload).encode()
+
+
+# Upper bound on a posted or edited message, in bytes. Larger requests are
+# refused before the body is stripped, sanitized or stored.
+MAX_MESSAGE_BYTES = 65536
+
+# Per-(user, ticket) token bucket for posting: POST_BURST messages at once,
+# refilled at POST_RATE per second. Kept per worker process, which is enough
+# to turn away floods before message_post runs.
+POST_RATE = 2.0
+POST_BURST = 5
+_POST_BUCKETS_MAX = 10000
+_POST_BUCKETS = {}
+
+# Bodies of the fixed error replies, encoded once at import. Only the bytes
+# are shared; every request still gets its own response object.
+_MESSAGE_NOT_FOUND = _encode({"success": False, "error": "Message not found"})
+_MESSAGE_EMPTY = _encode({"success": False, "error": "Message cannot be empty"})
+_MESSAGE_TOO_LONG = _encode({"success": False, "error": "Message too long"})
+_EDIT_FORBIDDEN = _encode(
+    {"success": False, "error": "You can only edit your own messages"}
+)
+_DELETE_FORBIDDEN = _encode(
+    {"success": False, "error": "You do not have permission to delete this message"}
+)
+
+
+def _evict_post_buckets(now):
+    """Make room in _POST_BUCKETS without refilling buckets that are draining.
+
+    Buckets are kept in last-use order. One untouched for POST_BURST /
+    POST_RATE seconds is full again, so dropping it changes nothing; only
+    when every bucket is newer than that are the least recently used dropped.
+    """
+    stale_before = now - POST_BURST / POST_RATE
+    for key, (stamp, _tokens) in list(_POST_BUCKETS.items()):
+        if stamp > stale_before and len(_POST_BUCKETS) < _POST_BUCKETS_MAX:
+            break
+        del _POST_BUCKETS[key]
+
+
+def _take_post_token(uid, ticket_id):
+    """Spend one posting token for ``(uid, ticket_id)``; False when exhausted."""
+    now = time.monotonic()
+    key = (uid, ticket_id)
+    # Re-inserted on every use so the dict stays ordered by last use.
+    stamp, tokens = _POST_BUCKETS.pop(key, (now, POST_BURST))
+    tokens = min(POST_BURST, tokens + (now - stamp) * POST_RATE)
+    allowed = tokens >= 1
+    if allowed:
+        tokens -= 1
+    if len(_POST_BUCKETS) >= _POST_BUCKETS_MAX:
+        _evict_post_buckets(now)
+    _POST_BUCKETS[key] = (now, tokens)
+    return allowed
+
+
+def _json_endpoint(handler):
+    """Serialize what an AJAX handler returns through _json_response().
+
+    The handler returns a dict or a pre-encoded body; any exception it
+    raises becomes ``{"success": False, "error": ...}``.
+    """
+
+    @functools.wraps(handler)
+    def wrapper(*args, **kwargs):
+        try:
+            result = handler(*args, **kwargs)
+        except Exception as e:
+            _logger.error("%s failed: %s", handler.__name__, e)
+            result = {"success": False, "error": str(e)}
+        return _json_response(result)
+
+    return wrapper
+
+
+def _ticket_redirect(ticket_id, **params):
+    """Redirect back to the ticket page with URL-encoded status ``params``."""
+    return request.redirect(
+        f"/customer_support/ticket/{ticket_id}?{urlencode(params)}"
+    )
+
+
+def _json_response(payload):
+    """JSON response for the AJAX message endpoints.
+
+    ``payload`` is either a dict to encode or an already-encoded body.
+    """
+    body = payload if isinstance(payload, bytes) else _encode(payload)
+    return request.make_response(
+        body, headers=[("Content-Type", "application/json")]
+    )
+
+
+def _session_partner_id():
+    """Partner id of the logged-in user, remembered in the session.
+
+    Stored with the uid it belongs to, so a re-login as someone else in the
+    same browser never reuses the previous user's partner.
+    """
+    uid = request.env.uid
+    cached = request.session.get("cs_partner")
+    if cached and cached[0] == uid:
+        return cached[1]
+    partner_id = request.env.user.partner_id.id
+    request.session["cs_partner"] = [uid, partner_id]
+    return partner_id
+
+
+def _message_author_and_thread(message_id):
+    """Return ``(author_id, res_id)`` of a mail.message, or None if it is gone.
+
+    One query covers both the existence check and the authorship test.
+    """
+    request.env["mail.message"].flush_model(["author_id", "res_id"])
+    request.env.cr.execute(
+        "SELECT author_id, res_id FROM mail_message WHERE id = %s",
+        [message_id],
+    )
+    return request.env.cr.fetchone()
+
+
+def _fast_edit_body(message_id, body):
+    """Replace a message's body with one UPDATE and return the stored HTML.
+
+    Skips the mail.message write pipeline (tracking, bus notifications),
+    which a portal body edit does not need. The body is sanitized exactly
+    as the ORM would sanitize the field.
+    """
+    body = str(html_sanitize(body, sanitize_style=True))
+    request.env.cr.execute(
+        """
+        UPDATE mail_message
+        SET body = %s, write_uid = %s, write_date = (now() at time zone 'UTC')
+        WHERE id = %s
+    """,
+        [body, request.env.uid, message_id],
+    )
+    request.env["mail.message"].browse(message_id).invalidate_recordset(
+        ["body", "write_uid", "write_date"]
+    )
+    return body
+
+
 class TicketMessaging(http.Controller):
 
     @http.route(
@@ -31,90 +189,61 @@ class TicketMessaging(http.Controller):
         Post Ticket Message - Handles posting messages to ticket communication
         Working: Creates new message in ticket's communication thread
         Access: Authenticated users (customers, support agents, admins)
-
-        Three fallback strategies are attempted in order:
-          1. message_post() with subtype
-          2. message_post() without subtype
-          3. Direct mail.message record creation
         """
-        try:
-            ticket = request.env["customer.support"].sudo().browse(ticket_id)
+        # The ticket page posts with fetch() and asks for JSON so it can
+        # append the new message in place; plain form posts get a redirect.
+        wants_json = request.httprequest.headers.get("Accept", "").startswith(
+            "application/json"
+        )
 
-            if not ticket.exists():
-                return request.redirect(
-                    f"/customer_support/ticket/{ticket_id}?error=Ticket not found"
-                )
+        def failure(error):
+            if wants_json:
+                return _json_response({"success": False, "error": error})
+            return _ticket_redirect(ticket_id, error=error)
+
+        try:
+            if (request.httprequest.content_length or 0) > MAX_MESSAGE_BYTES:
+                return failure("Message too long")
+            if not _take_post_token(request.env.uid, ticket_id):
+                return failure("You are sending messages too quickly. Please wait a moment.")
 
             message = post.get("message", "").strip()
             if not message:
-                return request.redirect(
-                    f"/customer_support/ticket/{ticket_id}?error=Message cannot be empty"
-                )
+                return failure("Message cannot be empty")
 
-            _logger.info(f"Attempting to post message to ticket {ticket_id}: {message}")
-
-            # Strategy 1: standard message_post with subtype
+            # No separate exists() query: posting on a deleted ticket raises
+            # MissingError inside the savepoint, which is rolled back.
+            ticket = request.env(su=True)["customer.support"].browse(ticket_id)
             try:
-                msg = ticket.message_post(
-                    body=message,
-                    message_type="comment",
-                    subtype_xmlid="mail.mt_comment",
-                    author_id=request.env.user.partner_id.id,
-                )
-                _logger.info(
-                    f"✓ Message posted successfully - ID: {msg.id if msg else 'N/A'}"
-                )
-                success_msg = "Message posted successfully"
-
-            except Exception as e1:
-                _logger.error(f"✗ message_post with subtype failed: {str(e1)}")
-
-                # Strategy 2: message_post without subtype
-                try:
+                with request.env.cr.savepoint():
                     msg = ticket.message_post(
                         body=message,
                         message_type="comment",
-                        author_id=request.env.user.partner_id.id,
-                    )
-                    _logger.info(
-                        f"✓ Message posted without subtype - ID: {msg.id if msg else 'N/A'}"
+                        subtype_xmlid="mail.mt_comment",
+                        author_id=_session_partner_id(),
                     )
-                    success_msg = "Message posted successfully"
-
-                except Exception as e2:
-                    _logger.error(f"✗ message_post without subtype failed: {str(e2)}")
-
-                    # Strategy 3: create mail.message record directly
-                    try:
-                        msg = (
-                            request.env["mail.message"]
-                            .sudo()
-                            .create(
-                                {
-                                    "model": "customer.support",
-                                    "res_id": ticket_id,
-                                    "body": message,
-                                    "message_type": "comment",
-                                    "author_id": request.env.user.partner_id.id,
-                                }
-                            )
-                        )
-                        _logger.info(f"✓ Message created directly - ID: {msg.id}")
-                        success_msg = "Message posted successfully"
-
-                    except Exception as e3:
-                        _logger.error(f"✗ All strategies failed: {str(e3)}")
-                        success_msg = f"Error posting message: {str(e3)}"
-
-            return request.redirect(
-                f"/customer_support/ticket/{ticket_id}?success={success_msg}"
-            )
+                _logger.info("Message %s posted to ticket %s", msg.id, ticket_id)
+            except MissingError:
+                return failure("Ticket not found")
+            except Exception as e:
+                _logger.error("Posting a message to ticket %s failed: %s", ticket_id, e)
+                if wants_json:
+                    return failure(f"Error posting message: {e}")
+                return _ticket_redirect(ticket_id, error=f"Error posting message: {e}")
+
+            if wants_json:
+                html = request.env["ir.qweb"]._render(
+                    "customer_support.ticket_message_item",
+                    {"activity": msg, "request": request},
+                )
+                return _json_response(
+                    {"success": True, "message_id": msg.id, "html": str(html)}
+                )
+            return _ticket_redirect(ticket_id, success="Message posted successfully")
 
         except Exception as e:
-            _logger.error(f"CRITICAL ERROR in post_message: {str(e)}")
-            return request.redirect(
-                f"/customer_support/ticket/{ticket_id}?error={str(e)}"
-            )
+            _logger.error("CRITICAL ERROR in post_message: %s", e)
+            return failure(str(e))
 
     @http.route(
         "/customer_support/ticket/message/<int:message_id>/edit",
@@ -123,6 +252,7 @@ class TicketMessaging(http.Controller):
         methods=["POST"],
         csrf=False,
     )
+    @_json_endpoint
     def edit_message(self, message_id, new_body=None, **kwargs):
         """
         Edit Message - AJAX endpoint for editing ticket messages
@@ -130,55 +260,29 @@ class TicketMessaging(http.Controller):
         Access: Message author only (users can only edit their own messages)
         Returns: JSON response with success/error status and updated body
         """
-        try:
-            message = request.env["mail.message"].sudo().browse(message_id)
+        if new_body and len(new_body.encode("utf-8", "ignore")) > MAX_MESSAGE_BYTES:
+            return _MESSAGE_TOO_LONG
 
-            if not message.exists():
-                return request.make_response(
-                    json.dumps({"success": False, "error": "Message not found"}),
-                    headers=[("Content-Type", "application/json")],
-                )
+        row = _message_author_and_thread(message_id)
+        if row is None:
+            return _MESSAGE_NOT_FOUND
 
-            # Only the author may edit their own message
-            user = request.env.user
-            is_author = message.author_id.id == user.partner_id.id
-
-            if not is_author:
-                return request.make_response(
-                    json.dumps(
-                        {
-                            "success": False,
-                            "error": "You can only edit your own messages",
-                        }
-                    ),
-                    headers=[("Content-Type", "application/json")],
-                )
+        # Only the author may edit their own message
+        is_author = row[0] == _session_partner_id()
 
-            if not new_body or not new_body.strip():
-                return request.make_response(
-                    json.dumps({"success": False, "error": "Message cannot be empty"}),
-                    headers=[("Content-Type", "application/json")],
-                )
+        if not is_author:
+            return _EDIT_FORBIDDEN
 
-            message.write({"body": new_body.strip()})
+        if not new_body or not new_body.strip():
+            return _MESSAGE_EMPTY
 
-            return request.make_response(
-                json.dumps(
-                    {
-                        "success": True,
-                        "message": "Message updated successfully",
-                        "new_body": new_body.strip(),
-                    }
-                ),
-                headers=[("Content-Type", "application/json")],
-            )
+        body = _fast_edit_body(message_id, new_body.strip())
 
-        except Exception as e:
-            _logger.error(f"Edit message error: {str(e)}")
-            return request.make_response(
-                json.dumps({"success": False, "error": str(e)}),
-                headers=[("Content-Type", "application/json")],
-            )
+        return {
+            "success": True,
+            "message": "Message updated successfully",
+            "new_body": body,
+        }
 
     @http.route(
         "/customer_support/ticket/message/<int:message_id>/delete",
@@ -187,6 +291,7 @@ class TicketMessaging(http.Controller):
         methods=["POST"],
         csrf=False,
     )
+    @_json_endpoint
     def delete_message(self, message_id, **kwargs):
         """
         Delete Message - AJAX endpoint for deleting ticket messages
@@ -194,48 +299,22 @@ class TicketMessaging(http.Controller):
         Access: Message author or system administrators
         Returns: JSON response with success/error status
         """
-        try:
-            message = request.env["mail.message"].sudo().browse(message_id)
-
-            if not message.exists():
-                return request.make_response(
-                    json.dumps({"success": False, "error": "Message not found"}),
-                    headers=[("Content-Type", "application/json")],
-                )
+        row = _message_author_and_thread(message_id)
+        if row is None:
+            return _MESSAGE_NOT_FOUND
 
-            # Only the message author or an admin may delete
-            user = request.env.user
-            is_admin = user.has_group("base.group_system")
-            is_author = message.author_id.id == user.partner_id.id
-
-            if not (is_admin or is_author):
-                return request.make_response(
-                    json.dumps(
-                        {
-                            "success": False,
-                            "error": "You do not have permission to delete this message",
-                        }
-                    ),
-                    headers=[("Content-Type", "application/json")],
-                )
+        # Only the message author or an admin may delete; the group check
+        # is skipped when the author deletes their own message.
+        is_author = row[0] == _session_partner_id()
 
-            ticket_id = message.res_id
-            message.unlink()
+        if not (is_author or request_is_admin(request)):
+            return _DELETE_FORBIDDEN
 
-            return request.make_response(
-                json.dumps(
-                    {
-                        "success": True,
-                        "message": "Message deleted successfully",
-                        "ticket_id": ticket_id,
-                    }
-                ),
-                headers=[("Content-Type", "application/json")],
-            )
+        ticket_id = row[1]
+        request.env(su=True)["mail.message"].browse(message_id).unlink()
 
-        except Exception as e:
-            _logger.error(f"Delete message error: {str(e)}")
-            return request.make_response(
-                json.dumps({"success": False, "error": str(e)}),
-                headers=[("Content-Type", "application/json")],
-            )
+        return {
+            "success": True,
+            "message": "Message deleted successfully",
+            "ticket_id": ticket_id,
+        }
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+Static Page Caching
+===================
+Conditional-GET support for the public pages whose markup does not depend
+on the visitor (the anonymous landing page and the /dragon-chat page).
+
+The ETag is derived from the page's view arch, the registry sequence (bumped
+on module install/upgrade, which is also when asset bundles change) and the
+language. A browser revalidating with a matching ETag gets a bare 304 and
+the QWeb template is not rendered at all.
+
+The pages are rendered through web.layout, which embeds the session's CSRF
+token, so they are marked ``private``: browsers may keep them, shared proxies
+may not. They are also ``no-cache`` so every visit revalidates; otherwise a
+visitor who logs in and returns to the landing page would be shown the stored
+anonymous copy instead of their dashboard link.
+"""
+
+import hashlib
+
+from odoo.http import request
+
+from .access import ref_id
+
+
+def static_page_etag(env, xmlid):
+    """Return an ETag for the rendered template ``xmlid``."""
+    view = env["ir.ui.view"].sudo().browse(ref_id(env, xmlid))
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{view.id}:{env.registry.registry_sequence}:{env.lang}:".encode())
+    digest.update((view.arch_db or "").encode())
+    return digest.hexdigest()
+
+
+def render_static_page(xmlid, values=None):
+    """Render ``xmlid`` with cache headers, answering 304 when the ETag matches."""
+    etag = static_page_etag(request.env, xmlid)
+    if request.httprequest.if_none_match.contains(etag):
+        response = request.make_response("", status=304)
+    else:
+        response = request.render(xmlid, values or {})
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response
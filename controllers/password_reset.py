@@ -36,8 +36,7 @@ class CustomerSupportPasswordReset(http.Controller):
     )
     def forgot_password(self, **post):
         user = request.env.user
-        public_user = request.env.ref("base.public_user")
-        if user and user.id != public_user.id and user.active:
+        if not user._is_public() and user.active:
             return werkzeug.utils.redirect(self._public_login_url())
 
         message = ""
@@ -124,8 +123,7 @@ class CustomerSupportPasswordReset(http.Controller):
     )
     def reset_password(self, **post):
         user = request.env.user
-        public_user = request.env.ref("base.public_user")
-        if user and user.id != public_user.id and user.active:
+        if not user._is_public() and user.active:
             return werkzeug.utils.redirect(self._public_login_url())
 
         token = (post.get("token") or request.params.get("token") or "").strip()
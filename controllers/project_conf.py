@@ -4,9 +4,18 @@ from odoo.http import request
 import logging
 import json
 from ..services.email_service import EmailService
+from .access import ref_id, request_is_admin
 
 _logger = logging.getLogger(__name__)
 
+# Compliance checkbox names; the form fields and the config fields share them.
+COMPLIANCE_FIELDS = (
+    "compliance_gdpr",
+    "compliance_hipaa",
+    "compliance_pci_dss",
+    "compliance_iso27001",
+)
+
 
 class CustomerSupportProjectController(http.Controller):
     @http.route(
@@ -69,10 +78,8 @@ class CustomerSupportProjectController(http.Controller):
             )
 
             # Step 2: Prepare compliance booleans
-            compliance_fields = ["gdpr", "hipaa", "pci_dss", "iso27001"]
             compliance_kwargs = {
-                f"compliance_{c}": bool(post.get(f"compliance_{c}"))
-                for c in compliance_fields
+                field: bool(post.get(field)) for field in COMPLIANCE_FIELDS
             }
 
             # Step 3: Create project configuration
@@ -117,8 +124,6 @@ class CustomerSupportProjectController(http.Controller):
             ConfigModel = request.env["customer_support.project.config"].sudo()
 
             project = ProjectModel.browse(project_id)
-            config = ConfigModel.search([("project_id", "=", project.id)], limit=1)
-
             if not project.exists():
                 return request.redirect(
                     "/customer_support/admin_dashboard/system_configuration?error=1&error_msg=Project not found&tab=project"
@@ -133,10 +138,8 @@ class CustomerSupportProjectController(http.Controller):
             )
 
             # Update or create config
-            compliance_fields = ["gdpr", "hipaa", "pci_dss", "iso27001"]
             compliance_kwargs = {
-                f"compliance_{c}": bool(post.get(f"compliance_{c}"))
-                for c in compliance_fields
+                field: bool(post.get(field)) for field in COMPLIANCE_FIELDS
             }
 
             config_vals = {
@@ -150,7 +153,10 @@ class CustomerSupportProjectController(http.Controller):
                 **compliance_kwargs,
             }
 
-            if config.exists():
+            # unique(project_id) indexes this lookup; an empty result is falsy,
+            # so no separate exists() query is needed.
+            config = ConfigModel.search([("project_id", "=", project.id)], limit=1)
+            if config:
                 config.write(config_vals)
             else:
                 ConfigModel.create({**config_vals, "project_id": project.id})
@@ -339,7 +345,7 @@ class CustomerSupportProjectController(http.Controller):
             })
 
             project_name = project.name
-            config.unlink()
+            # The config row goes with the project (ondelete="cascade").
             project.unlink()
 
             _logger.info(f"Project deleted & report generated: {project_name}")
@@ -426,41 +432,49 @@ class CustomerSupportProjectController(http.Controller):
             ConfigModel = request.env["customer_support.project.config"].sudo()
 
             project = ProjectModel.browse(project_id)
-            config = ConfigModel.search([("project_id", "=", project.id)], limit=1)
-
             if not project.exists():
                 return {"error": "Project not found"}
 
+            # One SELECT for every config column the modal shows; {} when the
+            # project has no configuration yet.
+            rows = ConfigModel.search_read(
+                [("project_id", "=", project.id)],
+                [
+                    "project_type",
+                    "project_goals",
+                    "start_date",
+                    "end_date",
+                    "programming_languages",
+                    "frameworks",
+                    "databases",
+                    *COMPLIANCE_FIELDS,
+                ],
+                limit=1,
+            )
+            cfg = rows[0] if rows else {}
+
             # Parse compliance
-            compliance = []
-            if config.exists():
-                for c in ["gdpr", "hipaa", "pci_dss", "iso27001"]:
-                    if getattr(config, f"compliance_{c}"):
-                        compliance.append(c.upper())
+            compliance = [
+                field.removeprefix("compliance_").upper()
+                for field in COMPLIANCE_FIELDS
+                if cfg.get(field)
+            ]
 
+            start_date = cfg.get("start_date")
+            end_date = cfg.get("end_date")
             return {
                 "success": True,
                 "project": {
                     "id": project.id,
                     "name": project.name,
                     "project_key": project.code,
-                    "project_type": config.project_type if config.exists() else "",
-                    "goals_objectives": config.project_goals if config.exists() else "",
-                    "start_date": (
-                        config.start_date.strftime("%Y-%m-%d")
-                        if config.exists() and config.start_date
-                        else ""
-                    ),
-                    "end_date": (
-                        config.end_date.strftime("%Y-%m-%d")
-                        if config.exists() and config.end_date
-                        else ""
-                    ),
-                    "programming_languages": (
-                        config.programming_languages if config.exists() else ""
-                    ),
-                    "frameworks": config.frameworks if config.exists() else "",
-                    "databases": config.databases if config.exists() else "",
+                    "project_type": cfg.get("project_type") or "",
+                    "goals_objectives": cfg.get("project_goals") or "",
+                    "start_date": start_date.strftime("%Y-%m-%d") if start_date else "",
+                    "end_date": end_date.strftime("%Y-%m-%d") if end_date else "",
+                    "programming_languages": cfg.get("programming_languages") or "",
+                    "frameworks": cfg.get("frameworks") or "",
+                    "databases": cfg.get("databases") or "",
                     "compliance_standards": compliance,
                 },
             }
@@ -501,8 +515,8 @@ class CustomerSupportProjectController(http.Controller):
     def get_focal_persons(self, **kw):
         """Return all active internal (focal person) users for the dropdown."""
         try:
-            internal_group_id = request.env.ref("base.group_user").id
-            system_group_id = request.env.ref("base.group_system").id
+            internal_group_id = ref_id(request.env, "base.group_user")
+            system_group_id = ref_id(request.env, "base.group_system")
             users = (
                 request.env["res.users"]
                 .sudo()
@@ -709,7 +723,7 @@ class CustomerSupportProjectController(http.Controller):
     def get_project_documents(self, project_id, **kw):
         """Return documents linked to a project."""
         try:
-            if not request.env.user.has_group("base.group_system"):
+            if not request_is_admin(request):
                 return {"error": "Access denied"}
             docs = (
                 request.env["dc.knowledge.document"]
@@ -746,7 +760,7 @@ class CustomerSupportProjectController(http.Controller):
     def delete_project_document(self, doc_id, **kw):
         """Delete a knowledge document."""
         try:
-            if not request.env.user.has_group("base.group_system"):
+            if not request_is_admin(request):
                 return {"error": "Access denied"}
             doc = request.env["dc.knowledge.document"].sudo().browse(doc_id)
             if not doc.exists():
@@ -17,6 +17,7 @@ import json
 import logging
 from odoo import http
 from odoo.http import request
+from .access import request_is_admin
 
 _logger = logging.getLogger(__name__)
 
@@ -84,7 +85,7 @@ class SLAPolicyController(http.Controller):
         """
         try:
             user = request.env.user
-            if not user.has_group("base.group_system"):
+            if not request_is_admin(request):
                 return request.make_response(
                     json.dumps({"success": False, "error": "Admin access required"}),
                     headers=[("Content-Type", "application/json")],
@@ -140,7 +141,7 @@ class SLAPolicyController(http.Controller):
         """
         try:
             user = request.env.user
-            if not user.has_group("base.group_system"):
+            if not request_is_admin(request):
                 return request.make_response(
                     json.dumps({"success": False, "error": "Admin access required"}),
                     headers=[("Content-Type", "application/json")],
@@ -198,7 +199,7 @@ class SLAPolicyController(http.Controller):
         """
         try:
             user = request.env.user
-            if not user.has_group("base.group_system"):
+            if not request_is_admin(request):
                 return request.make_response(
                     json.dumps({"success": False, "error": "Admin access required"}),
                     headers=[("Content-Type", "application/json")],
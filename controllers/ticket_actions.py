@@ -17,15 +17,23 @@ import logging
 import threading
 import odoo
 from odoo import http, fields
+from odoo.exceptions import MissingError
 from odoo.http import request
 from odoo.modules.registry import Registry
 import werkzeug
 
 from ..services.email_service import EmailService
 from ..services.email_templates import render_assignment_agent, render_assignment_customer
+from .access import request_is_admin
 
 _logger = logging.getLogger(__name__)
 
+# Newest messages rendered in a ticket's thread
+TICKET_MESSAGE_LIMIT = 100
+
+# mail.message types shown in a ticket's thread
+VISIBLE_MESSAGE_TYPES = ("comment", "notification")
+
 
 def _bg_post_assign(dbname, ticket_id, assigned_user_id, sla_note,
                     agent_email, agent_html, customer_email, customer_html,
@@ -95,28 +103,30 @@ class CustomerSupportTicketActions(http.Controller):
         type="http",
         auth="public",  # changed from "user" → supports public check inside
         website=True,
+        readonly=True,
     )
     def view_ticket(self, ticket_id, **kw):
         try:
             user = request.env.user
 
             # Redirect unauthenticated (public) users to login, preserving destination
-            if user.id == request.env.ref("base.public_user").id:
+            if user._is_public():
                 return werkzeug.utils.redirect(
                     f"/customer_support/login?redirect=/customer_support/ticket/{ticket_id}"
                 )
 
             ticket = request.env["customer.support"].browse(ticket_id)
-            if not ticket.exists():
+            try:
+                # The first field access loads the ticket's columns in one
+                # SELECT, which also proves the record exists.
+                is_assigned = ticket.assigned_to.id == user.id
+                is_customer = ticket.customer_id.id == user.partner_id.id
+            except MissingError:
                 return werkzeug.utils.redirect(
                     "/customer_support/dashboard?error=Ticket not found"
                 )
 
-            is_admin = user.has_group("base.group_system")
-            is_assigned = (
-                ticket.assigned_to.id == user.id if ticket.assigned_to else False
-            )
-            is_customer = ticket.customer_id.id == user.partner_id.id
+            is_admin = request_is_admin(request)
 
             # Enforce record-level access before loading related ticket data.
             if not (is_admin or is_assigned or is_customer):
@@ -124,41 +134,25 @@ class CustomerSupportTicketActions(http.Controller):
                     "/customer_support/dashboard?error=Access denied"
                 )
 
-            focal_persons = []
-            if is_admin:
-                focal_persons = request.env["res.users"].search(
-                    [("active", "=", True), ("id", "!=", 1)]
-                )
-
             # ── Fetch message thread ──────────────────────────────────────────
+            # Filtered and ordered by PostgreSQL on the (model, res_id) index
             activities = []
             try:
-                if hasattr(ticket, "message_ids") and ticket.message_ids:
-                    activities = list(
-                        ticket.message_ids.filtered(
-                            lambda m: m.message_type in ["comment", "notification"]
-                        ).sorted(key=lambda r: r.date, reverse=True)
+                activities = list(
+                    request.env["mail.message"]
+                    .sudo()
+                    .search(
+                        [
+                            ("model", "=", "customer.support"),
+                            ("res_id", "=", ticket_id),
+                            ("message_type", "in", VISIBLE_MESSAGE_TYPES),
+                        ],
+                        order="date desc",
+                        limit=TICKET_MESSAGE_LIMIT,
                     )
+                )
             except Exception as e:
-                _logger.error(f"message_ids failed: {str(e)}")
-
-            if not activities:
-                try:
-                    messages = (
-                        request.env["mail.message"]
-                        .sudo()
-                        .search(
-                            [
-                                ("model", "=", "customer.support"),
-                                ("res_id", "=", ticket_id),
-                                ("message_type", "in", ["comment", "notification"]),
-                            ],
-                            order="date desc",
-                        )
-                    )
-                    activities = list(messages)
-                except Exception as e:
-                    _logger.error(f"mail.message search failed: {str(e)}")
+                _logger.error("mail.message search failed: %s", e)
 
             # ── Fetch attachments ─────────────────────────────────────────────
             attachments = []
@@ -174,7 +168,7 @@ class CustomerSupportTicketActions(http.Controller):
                     )
                 )
             except Exception as e:
-                _logger.error(f"Attachment fetch failed: {str(e)}")
+                _logger.error("Attachment fetch failed: %s", e)
 
             # ── Fetch activity log for timeline ───────────────────────────────
             ticket_logs = []
@@ -188,10 +182,13 @@ class CustomerSupportTicketActions(http.Controller):
                     )
                 )
             except Exception as e:
-                _logger.error(f"Ticket log fetch failed: {str(e)}")
+                _logger.error("Ticket log fetch failed: %s", e)
 
             _logger.info(
-                f"User {user.name} viewing ticket {ticket_id}: {len(activities)} messages"
+                "User %s viewing ticket %s: %s messages",
+                user.name,
+                ticket_id,
+                len(activities),
             )
 
             return request.render(
@@ -202,7 +199,6 @@ class CustomerSupportTicketActions(http.Controller):
                     "is_admin": is_admin,
                     "is_assigned": is_assigned,
                     "is_customer": is_customer,
-                    "focal_persons": focal_persons,
                     "activities": activities,
                     "activities_count": len(activities),
                     "attachments": attachments,
@@ -215,7 +211,7 @@ class CustomerSupportTicketActions(http.Controller):
             )
 
         except Exception as e:
-            _logger.error(f"View ticket error: {str(e)}")
+            _logger.error("View ticket error: %s", e)
             return werkzeug.utils.redirect(
                 "/customer_support/dashboard?error=Error loading ticket"
             )
@@ -242,15 +238,17 @@ class CustomerSupportTicketActions(http.Controller):
         try:
             user = request.env.user
 
-            if not user.has_group("base.group_system"):
+            if not request_is_admin(request):
                 return _err("Access denied")
 
             ticket = request.env["customer.support"].browse(ticket_id)
-            if not ticket.exists():
+            try:
+                # Loads the ticket in one SELECT, which also proves it exists
+                current_project = ticket.project_id
+            except MissingError:
                 return _err("Ticket not found")
 
-            post_dict = dict(post) if not isinstance(post, dict) else post
-            assigned_to = post_dict.get("assigned_to")
+            assigned_to = post.get("assigned_to")
             if not assigned_to:
                 return _err("Please select a user to assign"
                 )
@@ -266,10 +264,10 @@ class CustomerSupportTicketActions(http.Controller):
             }
 
             # Set project_id from form, or auto-detect from focal person's mapping
-            project_id = post_dict.get("project_id", "").strip()
+            project_id = post.get("project_id", "").strip()
             if project_id:
                 write_vals["project_id"] = int(project_id)
-            elif not ticket.project_id:
+            elif not current_project:
                 # Auto-detect: if focal has exactly one project, use it
                 member = (
                     request.env["customer_support.project.member"]
@@ -280,7 +278,7 @@ class CustomerSupportTicketActions(http.Controller):
                     write_vals["project_id"] = member.project_id.id
 
             # Also create project.member record if not already mapped
-            final_project_id = write_vals.get("project_id") or (ticket.project_id.id if ticket.project_id else None)
+            final_project_id = write_vals.get("project_id") or current_project.id
             if final_project_id:
                 existing = (
                     request.env["customer_support.project.member"]
@@ -298,7 +296,7 @@ class CustomerSupportTicketActions(http.Controller):
                     })
 
             # SLA Policy
-            sla_policy_id = post_dict.get("sla_policy_id", "").strip()
+            sla_policy_id = post.get("sla_policy_id", "").strip()
             sla_note = ""
             if sla_policy_id:
                 try:
@@ -316,18 +314,25 @@ class CustomerSupportTicketActions(http.Controller):
                             f"(due {deadline.strftime('%Y-%m-%d %H:%M')})"
                         )
                         _logger.info(
-                            f"SLA policy '{policy.name}' attached to ticket {ticket_id}. "
-                            f"Deadline: {deadline}"
+                            "SLA policy '%s' attached to ticket %s. Deadline: %s",
+                            policy.name,
+                            ticket_id,
+                            deadline,
                         )
                 except Exception as sla_err:
                     _logger.warning(
-                        f"Could not attach SLA policy to ticket {ticket_id}: {sla_err}"
+                        "Could not attach SLA policy to ticket %s: %s",
+                        ticket_id,
+                        sla_err,
                     )
 
             ticket.write(write_vals)
             _logger.info(
-                f"Ticket {ticket.name} assigned to {assigned_user.name} "
-                f"by {user.name}{sla_note}"
+                "Ticket %s assigned to %s by %s%s",
+                ticket.name,
+                assigned_user.name,
+                user.name,
+                sla_note,
             )
 
             # Pre-render email content now (pure string ops, no SMTP, fast)
@@ -376,7 +381,7 @@ class CustomerSupportTicketActions(http.Controller):
             )
 
         except Exception as e:
-            _logger.exception(f"Assign ticket error: {str(e)}")
+            _logger.exception("Assign ticket error: %s", e)
             return request.make_response(
                 json.dumps({"success": False, "error": "Error assigning ticket"}),
                 headers=[("Content-Type", "application/json")],
@@ -404,7 +409,10 @@ class CustomerSupportTicketActions(http.Controller):
             user = request.env.user
             ticket = request.env["customer.support"].browse(ticket_id)
 
-            if not ticket.exists():
+            try:
+                # Loads the ticket in one SELECT, which also proves it exists
+                is_assigned = ticket.assigned_to.id == user.id
+            except MissingError:
                 if _is_ajax():
                     return request.make_response(
                         json.dumps({"success": False, "error": "Ticket not found"}),
@@ -415,10 +423,7 @@ class CustomerSupportTicketActions(http.Controller):
                     "/customer_support/dashboard?error=Ticket not found"
                 )
 
-            is_admin = user.has_group("base.group_system")
-            is_assigned = (
-                ticket.assigned_to.id == user.id if ticket.assigned_to else False
-            )
+            is_admin = request_is_admin(request)
 
             if not (is_admin or is_assigned):
                 if _is_ajax():
@@ -431,8 +436,7 @@ class CustomerSupportTicketActions(http.Controller):
                     f"/customer_support/ticket/{ticket_id}?error=Access denied"
                 )
 
-            post_dict = dict(post) if not isinstance(post, dict) else post
-            new_status = post_dict.get("status")
+            new_status = post.get("status")
 
             if not new_status:
                 if _is_ajax():
@@ -453,13 +457,17 @@ class CustomerSupportTicketActions(http.Controller):
             elif new_status == "closed":
                 update_vals["closed_date"] = fields.Datetime.now()
 
-            resolution_notes = post_dict.get("resolution_notes", "").strip()
+            resolution_notes = post.get("resolution_notes", "").strip()
             if resolution_notes:
                 update_vals["resolution_notes"] = resolution_notes
 
             ticket.write(update_vals)
             _logger.info(
-                f"Ticket {ticket.name} status: {old_status} → {new_status} by {user.name}"
+                "Ticket %s status: %s → %s by %s",
+                ticket.name,
+                old_status,
+                new_status,
+                user.name,
             )
 
             # Customer notification
@@ -477,14 +485,16 @@ class CustomerSupportTicketActions(http.Controller):
                     ticket, "status_change", notif_msg
                 )
             except Exception as ne:
-                _logger.warning(f"Could not create status notification: {ne}")
+                _logger.warning("Could not create status notification: %s", ne)
 
             # Email
             try:
                 EmailService.send_status_change_email(ticket, old_status, new_status)
             except Exception as email_error:
                 _logger.error(
-                    f"Status change email failed for ticket {ticket.name}: {str(email_error)}"
+                    "Status change email failed for ticket %s: %s",
+                    ticket.name,
+                    email_error,
                 )
 
             if _is_ajax():
@@ -505,7 +515,7 @@ class CustomerSupportTicketActions(http.Controller):
             )
 
         except Exception as e:
-            _logger.exception(f"Update status error: {str(e)}")
+            _logger.exception("Update status error: %s", e)
             if _is_ajax():
                 return request.make_response(
                     json.dumps({"success": False, "error": str(e)}),
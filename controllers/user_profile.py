@@ -1,10 +1,10 @@
 # -*- coding: utf-8 -*-
 import base64
-import json
 import logging
 from odoo import http
 from odoo.http import request
 import werkzeug
+from .access import request_is_admin, user_roles
 
 _logger = logging.getLogger(__name__)
 
@@ -12,10 +12,7 @@ _logger = logging.getLogger(__name__)
 class UserProfile(http.Controller):
 
     def _json_resp(self, data):
-        return request.make_response(
-            json.dumps(data),
-            headers=[("Content-Type", "application/json")],
-        )
+        return request.make_json_response(data)
 
     def _is_admin(self, user):
         return user.has_group("base.group_system")
@@ -56,16 +53,16 @@ class UserProfile(http.Controller):
         if not request.session.uid:
             return werkzeug.utils.redirect("/customer_support/login")
 
-        user = request.env.user
-        if target == "admin" and self._is_admin(user):
+        is_admin, is_portal, is_internal = user_roles(request.env.user)
+        if target == "admin" and is_admin:
             return werkzeug.utils.redirect("/customer_support/admin_dashboard")
-        if target == "support" and user.has_group("base.group_user"):
+        if target == "support" and is_internal:
             return werkzeug.utils.redirect("/customer_support/support_dashboard")
-        if user.has_group("base.group_portal"):
+        if is_portal:
             return werkzeug.utils.redirect("/customer_support/dashboard")
-        if user.has_group("base.group_user"):
+        if is_internal:
             return werkzeug.utils.redirect("/customer_support/support_dashboard")
-        if self._is_admin(user):
+        if is_admin:
             return werkzeug.utils.redirect("/customer_support/admin_dashboard")
         return werkzeug.utils.redirect("/customer_support/login")
 
@@ -81,7 +78,7 @@ class UserProfile(http.Controller):
             return login_redirect
 
         user = request.env.user
-        if user.has_group("base.group_system"):
+        if request_is_admin(request):
             return werkzeug.utils.redirect("/customer_support/admin_dashboard")
         if user.has_group("base.group_user"):
             return werkzeug.utils.redirect("/customer_support/support_dashboard")
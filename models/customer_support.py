@@ -10,11 +10,13 @@ Changes from original:
   Everything else is identical to the original.
 """
 
-from odoo import models, fields, api
+from odoo import SUPERUSER_ID, models, fields, api
 from datetime import timedelta
 import logging
 import secrets
 
+from .dashboard import ANALYTICS_TICKET_FIELDS
+
 _logger = logging.getLogger(__name__)
 
 STATUS_LABELS = {
@@ -33,6 +35,11 @@ class CustomerSupport(models.Model):
     _inherit = ["mail.thread", "mail.activity.mixin"]
     _order = "create_date desc"
 
+    # Dashboards list an agent's or a customer's tickets newest first; these
+    # serve both the filter and the ORDER BY.
+    _assigned_to_create_date_idx = models.Index("(assigned_to, create_date DESC)")
+    _customer_id_create_date_idx = models.Index("(customer_id, create_date DESC)")
+
     name = fields.Char(
         string="Ticket Number", required=True, copy=False, readonly=True, default="New"
     )
@@ -361,7 +368,7 @@ class CustomerSupport(models.Model):
             return
 
         params = self.env["ir.config_parameter"].sudo()
-        system_user_id = self.env.ref("base.user_root").id
+        system_user_id = SUPERUSER_ID
         last_user_id = state["last_user_id"]
         workload_cache = {}
 
@@ -437,6 +444,7 @@ class CustomerSupport(models.Model):
             # ─────────────────────────────────────────────────────────────
 
         records._auto_assign_new_tickets()
+        self.env["customer_support.dashboard"]._invalidate_analytics_cache()
 
         return records
 
@@ -451,6 +459,8 @@ class CustomerSupport(models.Model):
             vals.setdefault('sla_warning_sent', False)
 
         result = super(CustomerSupport, self).write(vals)
+        if ANALYTICS_TICKET_FIELDS.intersection(vals):
+            self.env["customer_support.dashboard"]._invalidate_analytics_cache()
 
         # Reset breach/overdue flags when a ticket is reopened
         if 'state' in vals and vals['state'] in ('new', 'in_progress', 'assigned', 'pending'):
@@ -515,6 +525,11 @@ class CustomerSupport(models.Model):
 
         return result
 
+    def unlink(self):
+        result = super(CustomerSupport, self).unlink()
+        self.env["customer_support.dashboard"]._invalidate_analytics_cache()
+        return result
+
     # ── Action Methods (all unchanged from original) ──────────────────────────
 
     def action_assign(self):
@@ -640,7 +655,7 @@ class CustomerSupport(models.Model):
                         f"Resolution required before "
                         f"{ticket.sla_deadline.strftime('%b %d, %I:%M %p')}."
                     ),
-                    actor_id=self.env.ref("base.user_root").id,
+                    actor_id=SUPERUSER_ID,
                 )
                 ticket.sudo().write({"sla_warning_sent": True})
 
@@ -665,7 +680,7 @@ class CustomerSupport(models.Model):
                     f"Ticket passed its SLA deadline on "
                     f"{ticket.sla_deadline.strftime('%b %d, %Y at %I:%M %p')}."
                 ),
-                actor_id=self.env.ref("base.user_root").id,
+                actor_id=SUPERUSER_ID,
             )
             ticket.sudo().write({"sla_breach_notified": True})
 
@@ -20,9 +20,53 @@ Models:
 from odoo import models, fields, api
 from datetime import datetime, timedelta
 import logging
+import time
 
 _logger = logging.getLogger(__name__)
 
+# Seconds a computed analytics/performance dict is served from memory.
+# Ticket changes in this worker drop the cache at once; the TTL bounds how
+# stale another worker's copy can get.
+ANALYTICS_CACHE_TTL = 60
+
+# Ticket fields the analytics depend on; writes touching none of them keep
+# the cache.
+ANALYTICS_TICKET_FIELDS = frozenset(
+    {"state", "priority", "assigned_to", "customer_id", "resolved_date", "closed_date"}
+)
+
+# Non-terminal ticket states
+OPEN_STATES = ("new", "assigned", "in_progress", "pending")
+
+# (dbname, metric, user_id) -> (expires_at, result)
+_ANALYTICS_CACHE = {}
+
+# Zeroed results, returned when a user has no tickets or a computation fails
+# so templates and the polling JS always get every key.
+ANALYTICS_DEFAULTS = {
+    "total_tickets": 0,
+    "open_tickets": 0,
+    "high_priority": 0,
+    "urgent": 0,
+    "avg_open_hours": 0,
+    "total_hours": 0,
+    "avg_high_hours": 0,
+    "avg_urgent_hours": 0,
+    "resolved_tickets": 0,
+    "solve_rate": 0,
+    "high_resolved": 0,
+    "urgent_resolved": 0,
+    "by_state": {},
+}
+
+PERFORMANCE_DEFAULTS = {
+    "today_closed": 0,
+    "avg_resolve_rate": 0,
+    "daily_target": 80.00,
+    "achievement": 0,
+    "sample_performance": 85.00,
+}
+
 
 # =============================================================================
 # PROJECT MODEL
@@ -49,6 +93,9 @@ class ResPartner(models.Model):
 
     _inherit = "res.partner"
 
+    # The portal login resolves an email to its user through the partner.
+    _email_idx = models.Index("(email)")
+
     project_id = fields.Many2one(
         "customer_support.project",
         string="Project",
@@ -69,9 +116,30 @@ class CustomerSupportDashboard(models.AbstractModel):
     # PRIVATE HELPERS
     # -------------------------------------------------------------------------
 
-    def _get_tickets_for_user(self, user_id):
+    def _cached_metric(self, metric, user_id, compute):
+        """
+        Return ``compute(user_id)`` for this database, reusing a result
+        younger than ANALYTICS_CACHE_TTL seconds.
         """
-        Return the correct ticket recordset based on the user's role.
+        key = (self.env.cr.dbname, metric, user_id)
+        now = time.monotonic()
+        hit = _ANALYTICS_CACHE.get(key)
+        if hit and hit[0] > now:
+            return dict(hit[1])
+        result = compute(user_id)
+        _ANALYTICS_CACHE[key] = (now + ANALYTICS_CACHE_TTL, result)
+        return dict(result)
+
+    @api.model
+    def _invalidate_analytics_cache(self):
+        """Drop every cached analytics/performance result for this database."""
+        dbname = self.env.cr.dbname
+        for key in [k for k in _ANALYTICS_CACHE if k[0] == dbname]:
+            _ANALYTICS_CACHE.pop(key, None)
+
+    def _get_ticket_domain_for_user(self, user_id):
+        """
+        Return the ticket search domain based on the user's role.
 
           - Admin       → ALL tickets in the system
           - Focal Person → tickets where assigned_to == user
@@ -80,25 +148,28 @@ class CustomerSupportDashboard(models.AbstractModel):
         This is the single source of truth for ticket scoping — every
         analytics method calls this instead of building its own domain.
         """
-        Ticket = self.env["customer.support"]
         user = self.env["res.users"].browse(user_id)
 
-        try:
-            if user.has_group("base.group_system"):
-                # Admin — full visibility across all tickets
-                _logger.debug(f"Dashboard: admin scope for user {user.name}")
-                return Ticket.search([])
+        if user.has_group("base.group_system"):
+            # Admin — full visibility across all tickets
+            _logger.debug(f"Dashboard: admin scope for user {user.name}")
+            return []
 
-            elif user.has_group("base.group_user"):
-                # Focal person / support agent — only assigned tickets
-                _logger.debug(f"Dashboard: agent scope for user {user.name}")
-                return Ticket.search([("assigned_to", "=", user_id)])
+        elif user.has_group("base.group_user"):
+            # Focal person / support agent — only assigned tickets
+            _logger.debug(f"Dashboard: agent scope for user {user.name}")
+            return [("assigned_to", "=", user_id)]
 
-            else:
-                # Portal user / customer — only their own tickets
-                _logger.debug(f"Dashboard: customer scope for user {user.name}")
-                return Ticket.search([("customer_id", "=", user.partner_id.id)])
+        else:
+            # Portal user / customer — only their own tickets
+            _logger.debug(f"Dashboard: customer scope for user {user.name}")
+            return [("customer_id", "=", user.partner_id.id)]
 
+    def _get_tickets_for_user(self, user_id):
+        """Return the ticket recordset in scope for the user's role."""
+        Ticket = self.env["customer.support"]
+        try:
+            return Ticket.search(self._get_ticket_domain_for_user(user_id))
         except Exception as e:
             _logger.error(f"_get_tickets_for_user failed for user {user_id}: {e}")
             return Ticket.browse()  # empty recordset — safe fallback
@@ -107,65 +178,79 @@ class CustomerSupportDashboard(models.AbstractModel):
     # PUBLIC ANALYTICS METHOD
     # -------------------------------------------------------------------------
 
+    def get_dashboard_payload(self, user_id):
+        """
+        Return ``(analytics, performance)`` for the given user.
+
+        Dashboards always need both; the per-state counts travel inside the
+        analytics (``by_state``), so callers need no aggregation of their own.
+        """
+        return self.get_ticket_analytics(user_id), self.get_user_performance(user_id)
+
     def get_ticket_analytics(self, user_id):
         """
         Return a dict of ticket analytics for the given user.
+        Results are cached briefly; see _cached_metric().
 
         Keys returned:
           total_tickets, open_tickets, high_priority, urgent,
           avg_open_hours, total_hours, avg_high_hours, avg_urgent_hours,
-          resolved_tickets, solve_rate, high_resolved, urgent_resolved
+          resolved_tickets, solve_rate, high_resolved, urgent_resolved,
+          by_state (ticket count per state)
 
-        Role-aware: uses _get_tickets_for_user() so the numbers are always
+        Role-aware: uses _get_ticket_domain_for_user() so the numbers are always
         correct regardless of whether the caller is admin, agent, or customer.
         """
+        return self._cached_metric(
+            "analytics", user_id, self._compute_ticket_analytics
+        )
+
+    def _compute_ticket_analytics(self, user_id):
         # Safe default — returned on any error so templates never break
-        default = {
-            "total_tickets": 0,
-            "open_tickets": 0,
-            "high_priority": 0,
-            "urgent": 0,
-            "avg_open_hours": 0,
-            "total_hours": 0,
-            "avg_high_hours": 0,
-            "avg_urgent_hours": 0,
-            "resolved_tickets": 0,
-            "solve_rate": 0,
-            "high_resolved": 0,
-            "urgent_resolved": 0,
-        }
+        default = dict(ANALYTICS_DEFAULTS, by_state={})
 
         try:
-            tickets = self._get_tickets_for_user(user_id)
-            total_tickets = len(tickets)
-
-            if total_tickets == 0:
-                return default
+            Ticket = self.env["customer.support"]
+            domain = self._get_ticket_domain_for_user(user_id)
 
-            # ------------------------------------------------------------------
-            # Open tickets — includes all non-terminal states
-            # BUG FIX: "assigned" was missing from the original filter
-            # ------------------------------------------------------------------
-            open_tickets = tickets.filtered(
-                lambda t: t.state in ["new", "assigned", "in_progress", "pending"]
+            # Every count comes from one GROUP BY state, priority instead of
+            # a filtered() pass per bucket over the whole recordset
+            groups = Ticket.read_group(
+                domain, ["state", "priority"], ["state", "priority"], lazy=False
             )
+            total_tickets = sum(row["__count"] for row in groups)
 
-            # High priority and urgent — only among OPEN tickets
-            high_priority = open_tickets.filtered(lambda t: t.priority == "high")
-            urgent_tickets = open_tickets.filtered(lambda t: t.priority == "urgent")
+            if total_tickets == 0:
+                return default
 
-            # Resolved / closed tickets
-            resolved_tickets = tickets.filtered(
-                lambda t: t.state in ["resolved", "closed"]
-            )
-            high_resolved = resolved_tickets.filtered(lambda t: t.priority == "high")
-            urgent_resolved = resolved_tickets.filtered(
-                lambda t: t.priority == "urgent"
-            )
+            by_state = {}
+            open_count = resolved_count = 0
+            high_priority = urgent_tickets = high_resolved = urgent_resolved = 0
+            for row in groups:
+                state, priority, count = row["state"], row["priority"], row["__count"]
+                by_state[state] = by_state.get(state, 0) + count
+                # Open tickets — includes all non-terminal states
+                # BUG FIX: "assigned" was missing from the original filter
+                if state in OPEN_STATES:
+                    open_count += count
+                    if priority == "high":
+                        high_priority += count
+                    elif priority == "urgent":
+                        urgent_tickets += count
+                elif state in ("resolved", "closed"):
+                    resolved_count += count
+                    if priority == "high":
+                        high_resolved += count
+                    elif priority == "urgent":
+                        urgent_resolved += count
+
+            # The time metrics still need the dates of each ticket
+            tickets = Ticket.search(domain)
+            open_tickets = tickets.filtered(lambda t: t.state in OPEN_STATES)
 
             # Solve rate as a percentage
             solve_rate = (
-                round(len(resolved_tickets) / total_tickets * 100, 2)
+                round(resolved_count / total_tickets * 100, 2)
                 if total_tickets > 0
                 else 0
             )
@@ -178,23 +263,24 @@ class CustomerSupportDashboard(models.AbstractModel):
 
             result = {
                 "total_tickets": total_tickets,
-                "open_tickets": len(open_tickets),
-                "high_priority": len(high_priority),
-                "urgent": len(urgent_tickets),
+                "open_tickets": open_count,
+                "high_priority": high_priority,
+                "urgent": urgent_tickets,
                 "avg_open_hours": avg_open_hours,
                 "total_hours": total_hours,
                 "avg_high_hours": avg_high_hours,
                 "avg_urgent_hours": avg_urgent_hours,
-                "resolved_tickets": len(resolved_tickets),
+                "resolved_tickets": resolved_count,
                 "solve_rate": solve_rate,
-                "high_resolved": len(high_resolved),
-                "urgent_resolved": len(urgent_resolved),
+                "high_resolved": high_resolved,
+                "urgent_resolved": urgent_resolved,
+                "by_state": by_state,
             }
 
             _logger.debug(
                 f"Analytics for user {user_id}: "
-                f"total={total_tickets}, open={len(open_tickets)}, "
-                f"resolved={len(resolved_tickets)}, solve_rate={solve_rate}%"
+                f"total={total_tickets}, open={open_count}, "
+                f"resolved={resolved_count}, solve_rate={solve_rate}%"
             )
 
             return result
@@ -210,6 +296,7 @@ class CustomerSupportDashboard(models.AbstractModel):
     def get_user_performance(self, user_id):
         """
         Return performance metrics for the given user.
+        Results are cached briefly; see _cached_metric().
 
         Keys returned:
           today_closed, avg_resolve_rate, daily_target,
@@ -221,13 +308,12 @@ class CustomerSupportDashboard(models.AbstractModel):
 
         BUG FIX: Original always used assigned_to which returned 0 for customers.
         """
-        default = {
-            "today_closed": 0,
-            "avg_resolve_rate": 0,
-            "daily_target": 80.00,
-            "achievement": 0,
-            "sample_performance": 85.00,
-        }
+        return self._cached_metric(
+            "performance", user_id, self._compute_user_performance
+        )
+
+    def _compute_user_performance(self, user_id):
+        default = dict(PERFORMANCE_DEFAULTS)
 
         try:
             user = self.env["res.users"].browse(user_id)
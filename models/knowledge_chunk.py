@@ -1,7 +1,8 @@
 import logging
-import requests
 from odoo import api, fields, models
 
+from ..services.rag_chatbot import OLLAMA_CONNECT_TIMEOUT, ollama_session
+
 _logger = logging.getLogger(__name__)
 
 OLLAMA_BASE_URL = "https://ai.dcpl.bt/ollama"
@@ -12,10 +13,10 @@ VECTOR_DIM = 768
 def get_embedding(text):
     """Get vector embedding from Ollama nomic-embed-text."""
     try:
-        response = requests.post(
+        response = ollama_session().post(
             f"{OLLAMA_BASE_URL}/api/embeddings",
             json={"model": EMBED_MODEL, "prompt": text},
-            timeout=30,
+            timeout=(OLLAMA_CONNECT_TIMEOUT, 30),
         )
         response.raise_for_status()
         return response.json().get("embedding", [])
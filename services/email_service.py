@@ -69,12 +69,12 @@ class EmailService:
     # ── Public send methods ───────────────────────────────────────────────────
 
     @staticmethod
-    def send_welcome_email(user_email, user_name, password):
+    def send_welcome_email(user_email, user_name, password, force_send=True):
         """Send welcome email to a newly created customer."""
         try:
             login_url = f"{EmailService._get_base_url()}/customer_support/login?force_login=1"
             body = render_welcome_customer(user_name, user_email, password, login_url)
-            EmailService._send("Welcome to Customer Support Portal", body, user_email, force_send=True)
+            EmailService._send("Welcome to Customer Support Portal", body, user_email, force_send=force_send)
             _logger.info(f"✓ Welcome email sent to {user_email}")
             return True
         except Exception as e:
@@ -82,7 +82,7 @@ class EmailService:
             return False
 
     @staticmethod
-    def send_welcome_email_focal_person(user_email, user_name, password):
+    def send_welcome_email_focal_person(user_email, user_name, password, force_send=True):
         """Send welcome email to a newly created support agent."""
         try:
             login_url = f"{EmailService._get_base_url()}/customer_support/login?force_login=1"
@@ -91,7 +91,7 @@ class EmailService:
                 "Welcome to Customer Support Portal - Support Agent Account",
                 body,
                 user_email,
-                force_send=True,
+                force_send=force_send,
             )
             _logger.info(f"✓ Agent welcome email sent to {user_email}")
             return True
@@ -3,6 +3,7 @@ import requests
 import json
 import logging
 import time
+from requests.adapters import HTTPAdapter
 
 _logger = logging.getLogger(__name__)
 
@@ -15,6 +16,28 @@ SIMILARITY_THRESHOLD = 0.20
 MAX_HISTORY = 4
 MAX_TOKENS = 250
 
+# (connect, read) timeouts in seconds. An unreachable Ollama host fails fast
+# instead of holding the HTTP worker for the whole read timeout.
+OLLAMA_CONNECT_TIMEOUT = 5
+OLLAMA_CHAT_TIMEOUT = (OLLAMA_CONNECT_TIMEOUT, 60)
+
+# One keep-alive connection pool per worker, shared by every Ollama call so
+# consecutive messages reuse the TLS connection instead of handshaking again.
+_OLLAMA_SESSION = None
+
+
+def ollama_session():
+    """Return the worker-wide pooled requests.Session for Ollama calls."""
+    global _OLLAMA_SESSION
+    if _OLLAMA_SESSION is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _OLLAMA_SESSION = session
+    return _OLLAMA_SESSION
+
+
 # ── Shared instant responses ──────────────────────────────────────────────────
 GREETINGS = {
     "hi",
@@ -240,7 +263,7 @@ class ChatBotBackend:
 
     def is_online(self):
         try:
-            r = requests.get(f"{self.base_url}/api/tags", timeout=5)
+            r = ollama_session().get(f"{self.base_url}/api/tags", timeout=5)
             return r.status_code == 200
         except Exception:
             return False
@@ -288,7 +311,7 @@ class ChatBotBackend:
         self.histories[user_id].append({"role": role, "content": content})
 
     def _call_ollama(self, messages):
-        response = requests.post(
+        response = ollama_session().post(
             f"{self.base_url}/api/chat",
             json={
                 "model": self.model,
@@ -301,7 +324,7 @@ class ChatBotBackend:
                     "num_predict": MAX_TOKENS,
                 },
             },
-            timeout=60,
+            timeout=OLLAMA_CHAT_TIMEOUT,
         )
         response.raise_for_status()
         return response.json()["message"]["content"]
@@ -388,7 +411,7 @@ class GeneralChatBackend:
         ]
 
         try:
-            response = requests.post(
+            response = ollama_session().post(
                 f"{self.base_url}/api/chat",
                 json={
                     "model": self.model,
@@ -401,7 +424,7 @@ class GeneralChatBackend:
                         "num_predict": MAX_TOKENS,
                     },
                 },
-                timeout=60,
+                timeout=OLLAMA_CHAT_TIMEOUT,
             )
             response.raise_for_status()
             raw = response.json()["message"]["content"]
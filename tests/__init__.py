@@ -1,3 +1,6 @@
 from . import common
 from . import test_authorization
 from . import test_security
+from . import test_admin_users
+from . import test_login
+from . import test_messaging
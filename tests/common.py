@@ -16,7 +16,7 @@ class CSBaseCase(HttpCase):
             "login": "cs_test_a@example.com",
             "email": "cs_test_a@example.com",
             "password": "TestPass_A1!",
-            "groups_id": [(6, 0, [portal_group.id])],
+            "group_ids": [(6, 0, [portal_group.id])],
         })
         cls.partner_a = cls.user_a.partner_id
 
@@ -26,7 +26,7 @@ class CSBaseCase(HttpCase):
             "login": "cs_test_b@example.com",
             "email": "cs_test_b@example.com",
             "password": "TestPass_B1!",
-            "groups_id": [(6, 0, [portal_group.id])],
+            "group_ids": [(6, 0, [portal_group.id])],
         })
         cls.partner_b = cls.user_b.partner_id
 
@@ -37,7 +37,7 @@ class CSBaseCase(HttpCase):
             "login": "cs_test_focal@example.com",
             "email": "cs_test_focal@example.com",
             "password": "TestPass_F1!",
-            "groups_id": [(6, 0, [internal_group.id])],
+            "group_ids": [(6, 0, [internal_group.id])],
         })
 
         # Ticket owned by user_a
@@ -0,0 +1,97 @@
+from odoo import http
+from odoo.tests.common import tagged
+from .common import CSBaseCase
+
+
+class CSAdminCase(CSBaseCase):
+    """CSBaseCase plus a system administrator for the admin routes."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.admin_user = cls.env["res.users"].sudo().with_context(no_reset_password=True).create({
+            "name": "CS Test Admin",
+            "login": "cs_test_admin@example.com",
+            "email": "cs_test_admin@example.com",
+            "password": "TestPass_Adm1!",
+            "group_ids": [(6, 0, [cls.env.ref("base.group_system").id])],
+        })
+
+    def _post_as_admin(self, url, data):
+        self.authenticate("cs_test_admin@example.com", "TestPass_Adm1!")
+        return self.url_open(
+            url,
+            data={**data, "csrf_token": http.Request.csrf_token(self)},
+            allow_redirects=False,
+        )
+
+
+@tagged("post_install", "-at_install", "customer_support")
+class TestAdminUserUniqueness(CSAdminCase):
+    """
+    TC-109  Creating a user with a taken email reports "already exists".
+    TC-110  Updating a user to a taken email reports "already exists".
+    """
+
+    # ------------------------------------------------------------------
+    # TC-109 — Duplicate email on create
+    # ------------------------------------------------------------------
+    def test_tc109_create_duplicate_email_rejected(self):
+        """The unique login index turns a duplicate into an error redirect."""
+        response = self._post_as_admin(
+            "/customer_support/admin_dashboard/submit_user",
+            {
+                "name": "Duplicate of A",
+                "email": "cs_test_a@example.com",
+                "password": "TestPass_D1!",
+                "user_type": "customer",
+            },
+        )
+        self.assertIn(response.status_code, [301, 302, 303])
+        location = response.headers.get("Location", "")
+        self.assertIn("/customer_support/admin_dashboard/create_user", location)
+        self.assertIn("already+exists", location)
+        self.assertEqual(
+            self.env["res.users"].sudo().search_count(
+                [("login", "=", "cs_test_a@example.com")]
+            ),
+            1,
+            msg="No second user may be created for a taken email",
+        )
+
+    # ------------------------------------------------------------------
+    # TC-110 — Duplicate email on update
+    # ------------------------------------------------------------------
+    def test_tc110_update_to_duplicate_email_rejected(self):
+        """Renaming user B to user A's email is refused and B is left unchanged."""
+        response = self._post_as_admin(
+            f"/customer_support/admin_dashboard/user/{self.user_b.id}/update",
+            {
+                "name": "CS Test Customer B",
+                "email": "cs_test_a@example.com",
+                "user_type": "customer",
+            },
+        )
+        self.assertIn(response.status_code, [301, 302, 303])
+        location = response.headers.get("Location", "")
+        self.assertIn(f"/customer_support/admin_dashboard/user/{self.user_b.id}/edit", location)
+        self.assertIn("already+exists", location)
+        self.user_b.invalidate_recordset(["login"])
+        self.assertEqual(self.user_b.login, "cs_test_b@example.com")
+
+
+@tagged("post_install", "-at_install", "customer_support")
+class TestAdminReporting(CSAdminCase):
+    """
+    TC-115  The reporting endpoint answers an admin with success.
+    """
+
+    def test_tc115_reporting_data_success(self):
+        """Every ?days= choice of the Reports tab returns a successful payload."""
+        self.authenticate("cs_test_admin@example.com", "TestPass_Adm1!")
+        for days in (7, 30, 90):
+            response = self.url_open(f"/customer_support/admin/reporting/data?days={days}")
+            self.assertEqual(response.status_code, 200)
+            body = response.json()
+            self.assertTrue(body.get("success"), msg=body.get("error"))
+            self.assertEqual(body.get("days"), days)
@@ -0,0 +1,70 @@
+from odoo import http
+from odoo.tests.common import tagged
+from .common import CSBaseCase
+
+
+@tagged("post_install", "-at_install", "customer_support")
+class TestLoginCandidate(CSBaseCase):
+    """
+    TC-111  An exact login match wins over another user's matching email.
+    TC-112  A user can sign in with their email when it differs from the login.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        Users = cls.env["res.users"].sudo().with_context(no_reset_password=True)
+        portal_group = cls.env.ref("base.group_portal")
+        # Logs in as "cs_shared@example.com"
+        cls.login_owner = Users.create({
+            "name": "CS Test Login Owner",
+            "login": "cs_shared@example.com",
+            "email": "cs_login_owner@example.com",
+            "password": "TestPass_L1!",
+            "group_ids": [(6, 0, [portal_group.id])],
+        })
+        # Has "cs_shared@example.com" as email, under a different login
+        cls.email_owner = Users.create({
+            "name": "CS Test Email Owner",
+            "login": "cs_email_owner",
+            "email": "cs_shared@example.com",
+            "password": "TestPass_E1!",
+            "group_ids": [(6, 0, [portal_group.id])],
+        })
+
+    def _login(self, email, password):
+        self.authenticate(None, None)
+        return self.url_open(
+            "/customer_support/authenticate",
+            data={
+                "email": email,
+                "password": password,
+                "csrf_token": http.Request.csrf_token(self),
+            },
+            allow_redirects=False,
+        )
+
+    def _assert_logged_in(self, response):
+        self.assertIn(response.status_code, [301, 302, 303])
+        location = response.headers.get("Location", "")
+        self.assertIn("/customer_support/dashboard", location)
+        self.assertNotIn("error=", location)
+
+    # ------------------------------------------------------------------
+    # TC-111 — Exact login match is the only candidate tried
+    # ------------------------------------------------------------------
+    def test_tc111_exact_login_wins(self):
+        """The login owner's password signs in; the email owner's does not."""
+        self._assert_logged_in(self._login("cs_shared@example.com", "TestPass_L1!"))
+
+        response = self._login("cs_shared@example.com", "TestPass_E1!")
+        location = response.headers.get("Location", "")
+        self.assertIn("/customer_support/login", location)
+        self.assertIn("error=", location)
+
+    # ------------------------------------------------------------------
+    # TC-112 — Email fallback
+    # ------------------------------------------------------------------
+    def test_tc112_email_login(self):
+        """An email matching no login resolves to the user holding that email."""
+        self._assert_logged_in(self._login("cs_login_owner@example.com", "TestPass_L1!"))
@@ -0,0 +1,50 @@
+from odoo import http
+from odoo.tests.common import tagged
+from .common import CSBaseCase
+
+
+@tagged("post_install", "-at_install", "customer_support")
+class TestPostTicketMessage(CSBaseCase):
+    """
+    TC-113  Posting with Accept: application/json returns the rendered message.
+    TC-114  Plain form posts keep the redirect back to the ticket.
+    """
+
+    def _post_message(self, message, headers=None):
+        self.authenticate("cs_test_a@example.com", "TestPass_A1!")
+        return self.url_open(
+            f"/customer_support/ticket/{self.ticket_a.id}/post_message",
+            data={"message": message, "csrf_token": http.Request.csrf_token(self)},
+            headers=headers,
+            allow_redirects=False,
+        )
+
+    # ------------------------------------------------------------------
+    # TC-113 — JSON reply for the in-page composer
+    # ------------------------------------------------------------------
+    def test_tc113_json_reply(self):
+        """The reply carries the new message id and its thread markup."""
+        response = self._post_message(
+            "Posted over fetch", headers={"Accept": "application/json"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("application/json", response.headers.get("Content-Type", ""))
+        body = response.json()
+        self.assertTrue(body.get("success"), msg=body.get("error"))
+        self.assertIn("Posted over fetch", body.get("html", ""))
+
+        message = self.env["mail.message"].sudo().browse(body["message_id"])
+        self.assertEqual(message.model, "customer.support")
+        self.assertEqual(message.res_id, self.ticket_a.id)
+
+    # ------------------------------------------------------------------
+    # TC-114 — Redirect for plain form posts
+    # ------------------------------------------------------------------
+    def test_tc114_form_post_redirects(self):
+        """Without the JSON Accept header the handler redirects to the ticket."""
+        response = self._post_message("Posted from the form")
+        self.assertIn(response.status_code, [301, 302, 303])
+        self.assertIn(
+            f"/customer_support/ticket/{self.ticket_a.id}",
+            response.headers.get("Location", ""),
+        )